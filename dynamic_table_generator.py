@@ -7,17 +7,63 @@ based on various dimensions and value ranges.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+import logging
+import re
 import sys
 from collections import defaultdict
 from tqdm import tqdm
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# Plain ISO dates (2021-11-23) are validated with date.fromisoformat instead of
+# a full pandas parse
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Optional Numba JIT for the batch years-ago kernel (pip install numba)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _years_ago_kernel(years, current_year):
+        """Years between each year and current_year; NaN where the year is unknown."""
+        out = np.empty(years.size, np.float64)
+        for i in prange(years.size):
+            out[i] = current_year - years[i] if years[i] > 0 else np.nan
+        return out
+else:
+    def _years_ago_kernel(years, current_year):
+        """Years between each year and current_year; NaN where the year is unknown."""
+        return np.where(years > 0, current_year - years, np.nan)
+
 
 class DynamicTableGenerator:
     """Generator for creating dynamic tables from CSV data with specified ranges."""
 
+    # Rows read per chunk; bounds peak memory on large input files
+    CSV_CHUNK_SIZE = 200_000
+
+    # Columns the output table is grouped by
+    DIMENSION_COLUMNS = [
+        'FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type',
+        'SaleDate_Range', 'BuildDate_Range', 'TotalValue_Range',
+        'LTV_Range', 'LotSizeSqFt_Range', 'SumLivingAreaSqFt_Range'
+    ]
+
+    # Text columns pinned to str so every chunk parses them the same way
+    # (dtype inference per chunk could otherwise mix '49051' and '49051.0')
+    SOURCE_DTYPES = {
+        'FIPS': str, 'SitusCity': str, 'SitusZIP5': str, 'Owner_Type': str, 'Use_Type': str,
+        'SitusFullStreetAddress': str, 'MailingFullStreetAddress': str, 'MailingZIP5': str,
+    }
+
     def __init__(self, input_folder='Files', output_folder='output', customer_name=None, suppress_folder=None):
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder)
@@ -28,8 +74,9 @@ class DynamicTableGenerator:
         # Suppression records will be loaded in process_csv_files
         self.suppression_records = set()
 
-        # Define all range buckets
+        # Define all range buckets and their searchsorted lookup tables
         self.define_ranges()
+        self._compile_ranges()
 
         # Define distress mapping: display_name -> (raw_column, condition)
         # condition can be: 'boolean' (truthy check), 'equals_1', 'equals_2', or a specific value
@@ -180,6 +227,14 @@ class DynamicTableGenerator:
         # Ordered list of distress column names for consistent output
         self.distress_columns = list(self.distress_mapping.keys())
 
+        # Source columns read from each CSV: dimensions, values, dates,
+        # suppression addresses and the raw distress flags
+        self.source_columns = frozenset([
+            *self.SOURCE_DTYPES,
+            'saleDate', 'buildDate', 'totalValue', 'LTV', 'LotSizeSqFt', 'SumLivingAreaSqFt',
+            *(raw_column for raw_column, _ in self.distress_mapping.values()),
+        ])
+
     def detect_distress_vectorized(self, df):
         """
         Detect and populate distress indicator columns using vectorized operations.
@@ -218,7 +273,12 @@ class DynamicTableGenerator:
         return df
 
     def categorize_value(self, value, ranges, value_is_dollar=False):
-        """Categorize a value into one of the defined ranges."""
+        """
+        Categorize a value into one of the defined ranges.
+
+        Null, empty and non-numeric values, and numbers no range covers
+        (negative values or gaps between ranges), return the Unknown category.
+        """
         # Handle unknown/null/empty values
         if pd.isna(value) or value == '' or value == 'Unknown' or value == 'unknown':
             return ranges[0][1]  # Return 'Unknowns' or 'Unknown'
@@ -230,25 +290,151 @@ class DynamicTableGenerator:
                 num_value = float(value) / 1000  # Convert to thousands
             else:
                 num_value = float(value)
+        except (ValueError, TypeError):
+            return ranges[0][1]  # Return 'Unknowns' or 'Unknown' if conversion fails
+
+        # Binary search over the precomputed range edges
+        edges, codes, labels = self._range_table(ranges)
+        return labels[codes[edges.searchsorted(num_value, side='right')]]
+
+    def _compile_ranges(self):
+        """
+        Precompute the searchsorted lookup table of every range list.
+
+        Tables are cached by id() together with the list they were built from,
+        and only used while that exact list is passed in, so a reassigned
+        range list (even one that reuses a freed id) gets a fresh table. Call
+        this again after replacing a range list to re-cache it and to rebuild
+        categorize_total_value / categorize_living_area.
+        """
+        self._range_tables = {
+            id(ranges): (ranges, self._build_range_table(ranges))
+            for ranges in (
+                self.total_value_ranges,
+                self.living_area_ranges,
+                self.lot_size_ranges,
+                self.build_date_ranges,
+                self.ltv_ranges,
+                self.sale_date_ranges,
+            )
+        }
+
+        # Date ranges are also resolved straight from the year
+        self._year_labels = {
+            id(ranges): (ranges, self._build_year_labels(ranges))
+            for ranges in (self.build_date_ranges, self.sale_date_ranges)
+        }
+
+        # Scalar categorizers for the two hot value columns, with the range
+        # table and dollar scaling bound in
+        self.categorize_total_value = self._make_value_categorizer(self.total_value_ranges, divisor=1000)
+        self.categorize_living_area = self._make_value_categorizer(self.living_area_ranges)
+
+    def _make_value_categorizer(self, ranges, divisor=1):
+        """
+        Build a scalar categorizer specialized for one range list.
+
+        Behaves like categorize_value(value, ranges), with the lookup table and
+        unit conversion resolved once instead of on every call.
+
+        Args:
+            ranges: Range list to categorize into
+            divisor: Value the raw number is divided by (1000 for dollar values)
+
+        Returns:
+            Function mapping a single value to its range display label
+        """
+        edges, codes, labels = self._range_table(ranges)
+        unknown = ranges[0][1]
+        searchsorted = edges.searchsorted
+
+        def categorize(value):
+            if pd.isna(value) or value == '' or value == 'Unknown' or value == 'unknown':
+                return unknown
+            try:
+                num_value = float(value) / divisor
+            except (ValueError, TypeError):
+                return unknown
+            return labels[codes[searchsorted(num_value, side='right')]]
+
+        return categorize
+
+    def _range_table(self, ranges):
+        """Get the lookup table for a range list, building it for ad-hoc lists."""
+        entry = self._range_tables.get(id(ranges))
+        if entry is None or entry[0] is not ranges:
+            return self._build_range_table(ranges)
+        return entry[1]
+
+    @staticmethod
+    def _build_range_table(ranges):
+        """
+        Build the searchsorted lookup table for a ranges list.
+
+        Every finite bound b contributes the edges b and nextafter(b, inf), so
+        np.searchsorted(edges, v, side='right') lands on a bin of its own when
+        v == b exactly (needed for exact-match ranges like $0) and on the bin
+        between bounds otherwise. Bins that no range covers (negative values,
+        and gaps between ranges such as LTV 69-70) resolve to the Unknown
+        category, code 0.
 
-            # Find the appropriate range
-            for range_label, range_display, min_val, max_val in ranges:
-                if min_val is None:  # This is the Unknown category
+        Returns:
+            Tuple of (sorted edges, range index per bin, display labels)
+        """
+        bounds = sorted({bound for _, _, min_val, max_val in ranges[1:]
+                         for bound in (min_val, max_val) if bound != float('inf')})
+        edges = np.empty(2 * len(bounds), dtype=np.float64)
+        edges[0::2] = bounds
+        edges[1::2] = np.nextafter(bounds, np.inf)
+
+        def range_code(num_value):
+            for code, (_, _, min_val, max_val) in enumerate(ranges):
+                if min_val is None:
                     continue
-                # Special case: exact match for ranges where min_val == max_val (like $0)
                 if min_val == max_val and num_value == min_val:
-                    return range_display
-                # Use < for upper bound (ranges are defined with exclusive upper bounds)
+                    return code
                 if min_val <= num_value < max_val:
-                    return range_display
+                    return code
                 if min_val <= num_value and max_val == float('inf'):
-                    return range_display
+                    return code
+            return 0
+
+        # One representative value per bin: below the first edge, each edge
+        # itself, and the midpoint between consecutive edges
+        samples = [edges[0] - 1]
+        for i, edge in enumerate(edges):
+            if i % 2 == 0:
+                samples.append(edge)
+            elif i + 1 < len(edges):
+                samples.append((edge + edges[i + 1]) / 2)
+            else:
+                samples.append(edge + 1)
+        codes = np.array([range_code(sample) for sample in samples], dtype=np.int8)
+        labels = np.array([range_display for _, range_display, _, _ in ranges], dtype=object)
 
-            # If no range found, return the last range (typically the "+" range)
-            return ranges[-1][1]
+        return edges, codes, labels
 
-        except (ValueError, TypeError):
-            return ranges[0][1]  # Return 'Unknowns' or 'Unknown' if conversion fails
+    def categorize_value_series(self, series, ranges, value_is_dollar=False):
+        """
+        Vectorized equivalent of categorize_value for a whole Series.
+
+        Values are binned with a single np.searchsorted over the range edges.
+        Nulls, non-numeric values and numbers no range covers map to the
+        Unknown category, as in categorize_value.
+
+        Returns:
+            Categorical Series whose categories are the range display labels
+        """
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        if value_is_dollar:
+            values = values / 1000  # Convert to thousands
+
+        edges, codes, labels = self._range_table(ranges)
+        result_codes = codes[np.searchsorted(edges, values, side='right')]
+        result_codes[np.isnan(values)] = 0  # Unknown category
+
+        return pd.Series(pd.Categorical.from_codes(result_codes, categories=labels),
+                         index=series.index)
 
     def calculate_years_ago(self, date_value):
         """Calculate how many years ago from current date."""
@@ -285,34 +471,115 @@ class DynamicTableGenerator:
 
             # Calculate years ago
             current_date = datetime.now()
-            date_series = pd.to_datetime(date_series, errors='coerce')
             years_ago = (current_date - date_obj).days / 365.25
             return years_ago
 
         except Exception as e:
-            # Log the error for debugging
-            # print(f"Warning: Could not parse date '{date_value}': {e}")
+            # Runs once per row, so only build the message when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Could not parse date %r: %s", date_value, e)
+            return None
+
+    def calculate_years_ago_batch(self, years, current_year=None):
+        """
+        Calculate years ago for an array of years (batch counterpart of calculate_years_ago).
+
+        Runs as a parallel Numba kernel when numba is installed, and as a
+        single NumPy expression otherwise. Only numeric years reach the
+        kernel; date strings are parsed beforehand by extract_years.
+
+        Args:
+            years: Array of years, NaN where unknown
+            current_year: Reference year (defaults to the current year)
+
+        Returns:
+            float64 array of years ago, NaN where the year is unknown
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+        return _years_ago_kernel(np.asarray(years, dtype=np.float64), current_year)
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
+    def extract_year(date_value):
+        """
+        Extract the year of a single date value (scalar counterpart of extract_years).
+
+        Memoized: the same date strings repeat across many rows, and the
+        result does not depend on the current date or the generator state.
+
+        Returns:
+            Year as int, or None if no year in 1800-2100 can be found
+        """
+        if pd.isna(date_value) or date_value == '' or date_value == 'Unknown':
+            return None
+
+        # Timestamps, datetimes and datetime64 values carry the year directly
+        if isinstance(date_value, (date, np.datetime64)):
+            try:
+                year = pd.Timestamp(date_value).year
+            except (ValueError, OverflowError):
+                return None
+            return year if 1800 <= year <= 2100 else None
+
+        try:
+            num_value = float(date_value)
+            if 1800 <= num_value <= 2100:
+                return int(num_value)
+        except (ValueError, TypeError):
+            pass
+
+        if not isinstance(date_value, str):
             return None
 
+        # Fast path for plain ISO dates such as 2021-11-23; impossible ones
+        # like 2021-02-30 are rejected, as in the batch parser
+        if _ISO_DATE.fullmatch(date_value):
+            try:
+                year = date.fromisoformat(date_value).year
+            except ValueError:
+                return None
+        else:
+            date_obj = pd.to_datetime(date_value, errors='coerce')
+            if pd.isna(date_obj):
+                return None
+            year = date_obj.year
+
+        return year if 1800 <= year <= 2100 else None
+
+    def _years_ago_codes(self, years_ago, ranges):
+        """
+        Resolve an array of years-ago values to range codes.
+
+        Unknown years (NaN) and future dates (negative years ago, below the
+        first range) both map to code 0, the Unknown category.
+
+        Returns:
+            Tuple of (range code per value, display labels)
+        """
+        edges, codes, labels = self._range_table(ranges)
+        result_codes = codes[np.searchsorted(edges, years_ago, side='right')]
+        result_codes[~(years_ago >= ranges[1][2])] = 0  # Unknown category
+        return result_codes, labels
+
+    def _build_year_labels(self, ranges):
+        """Map every valid year (1800-2100) to its years-ago range label."""
+        current_year = datetime.now().year
+        years = np.arange(1800, 2101)
+        year_codes, labels = self._years_ago_codes((current_year - years).astype(np.float64), ranges)
+        return dict(zip(years.tolist(), labels[year_codes].tolist()))
+
     def categorize_date(self, date_value, ranges):
         """Categorize a date value into years-ago ranges."""
-        years_ago = self.calculate_years_ago(date_value)
+        year = self.extract_year(date_value)
 
-        if years_ago is None:
+        if year is None:
             return ranges[0][1]  # Return 'Unknown'
 
-        # Find the appropriate range
-        for range_label, range_display, min_val, max_val in ranges:
-            if min_val is None:  # This is the Unknown category
-                continue
-            # Use < for upper bound (ranges are defined with exclusive upper bounds)
-            if min_val <= years_ago < max_val:
-                return range_display
-            if min_val <= years_ago and max_val == float('inf'):
-                return range_display
-
-        # If no range found, return the last range
-        return ranges[-1][1]
+        entry = self._year_labels.get(id(ranges))
+        if entry is None or entry[0] is not ranges:
+            return self._build_year_labels(ranges)[year]
+        return entry[1][year]
 
     def load_suppression_records(self):
         """Load suppression records from the suppress folder."""
@@ -386,7 +653,7 @@ class DynamicTableGenerator:
                 # Extract records from property address - VECTORIZED
                 if property_col:
                     prop_addr_clean = df[property_col].fillna('').astype(str).str.strip().str.lower()
-                    prop_zip_clean = df[property_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True) if property_zip_col else pd.Series([''] * len(df))
+                    prop_zip_clean = df[property_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True) if property_zip_col else pd.Series([''] * len(df))
 
                     # Filter out empty addresses
                     valid_mask = prop_addr_clean != ''
@@ -400,7 +667,7 @@ class DynamicTableGenerator:
                 # Extract records from mailing address - VECTORIZED
                 if mailing_col:
                     mail_addr_clean = df[mailing_col].fillna('').astype(str).str.strip().str.lower()
-                    mail_zip_clean = df[mailing_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True) if mailing_zip_col else pd.Series([''] * len(df))
+                    mail_zip_clean = df[mailing_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True) if mailing_zip_col else pd.Series([''] * len(df))
 
                     # Filter out empty addresses
                     valid_mask = mail_addr_clean != ''
@@ -461,7 +728,9 @@ class DynamicTableGenerator:
         # Check property address + zip combinations - VECTORIZED
         if 'SitusFullStreetAddress' in df.columns and 'SitusZIP5' in df.columns:
             prop_addr_clean = df['SitusFullStreetAddress'].fillna('').astype(str).str.strip().str.lower()
-            prop_zip_clean = df['SitusZIP5'].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+            # ZIPs are read as text (leading zeros kept) while suppression files
+            # are read untyped, so both sides drop leading zeros in the key
+            prop_zip_clean = df['SitusZIP5'].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True)
 
             # Create tuples for comparison
             prop_tuples = list(zip(prop_addr_clean, prop_zip_clean))
@@ -475,7 +744,7 @@ class DynamicTableGenerator:
         # Check mailing address + zip combinations - VECTORIZED
         if 'MailingFullStreetAddress' in df.columns and 'MailingZIP5' in df.columns:
             mail_addr_clean = df['MailingFullStreetAddress'].fillna('').astype(str).str.strip().str.lower()
-            mail_zip_clean = df['MailingZIP5'].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+            mail_zip_clean = df['MailingZIP5'].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True)
 
             # Create tuples for comparison
             mail_tuples = list(zip(mail_addr_clean, mail_zip_clean))
@@ -491,87 +760,129 @@ class DynamicTableGenerator:
 
         return df_filtered, suppressed_count
 
-    def categorize_column_vectorized(self, series, ranges, value_is_dollar=False):
-        """Vectorized categorization of a pandas Series into ranges."""
-        # Handle dollar values - convert to thousands
-        if value_is_dollar:
-            series = pd.to_numeric(series, errors='coerce') / 1000
-        else:
-            series = pd.to_numeric(series, errors='coerce')
+    def extract_years(self, series):
+        """
+        Extract the year of every value in a date column.
 
-        # Create result series filled with the unknown category
-        result = pd.Series([ranges[0][1]] * len(series), index=series.index)
+        Numeric values in 1800-2100 are taken as years (e.g., 1990, 2005).
+        Everything else is parsed once with the ISO 8601 fast path, and only
+        the values it rejects (e.g., US-style 11/23/2021) fall back to mixed
+        format parsing.
 
-        # Process each range
-        for range_label, range_display, min_val, max_val in ranges:
-            if min_val is None:  # Skip the Unknown category
-                continue
+        Returns:
+            float64 array of years, NaN where no valid year was found
+        """
+        numeric_values = pd.to_numeric(series, errors='coerce')
+        numeric_year_mask = (numeric_values >= 1800) & (numeric_values <= 2100)
+        years = numeric_values.where(numeric_year_mask).to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
 
-            if min_val == max_val:  # Exact match ranges (like $0)
-                mask = series == min_val
-            elif max_val == float('inf'):  # Open-ended ranges
-                mask = series >= min_val
-            else:  # Normal ranges
-                mask = (series >= min_val) & (series < max_val)
+        pending = np.isnan(years) & series.notna().to_numpy()
+        if pending.any():
+            candidates = series[pending].astype(str)
+            parsed_dates = pd.to_datetime(candidates, format='ISO8601', errors='coerce', cache=True)
+            retry = parsed_dates.isna() & (candidates != '') & (candidates != 'Unknown')
+            if retry.any():
+                parsed_dates[retry] = pd.to_datetime(candidates[retry], format='mixed', errors='coerce')
 
-            result[mask] = range_display
+            parsed_years = parsed_dates.dt.year
+            # Filter to valid year range (1800-2100) to avoid garbage data
+            parsed_years = parsed_years.where((parsed_years >= 1800) & (parsed_years <= 2100))
+            years[pending] = parsed_years.to_numpy(dtype=np.float64, na_value=np.nan)
 
-        return result
+        return years
 
-    def categorize_dates_vectorized(self, series, ranges):
+    def categorize_date_series(self, series, ranges):
         """
-        Vectorized categorization of date column into years-ago ranges.
+        Vectorized equivalent of categorize_date for a whole Series.
 
         Uses year extraction instead of datetime arithmetic to avoid overflow
         errors with malformed/extreme dates in the source data.
+
+        Returns:
+            Categorical Series whose categories are the range display labels
         """
-        current_year = datetime.now().year
+        years_ago = self.calculate_years_ago_batch(self.extract_years(series))
+        result_codes, labels = self._years_ago_codes(years_ago, ranges)
 
-        # Initialize years_ago as NaN (will be filled with valid values)
-        years_ago = pd.Series([np.nan] * len(series), index=series.index)
+        return pd.Series(pd.Categorical.from_codes(result_codes, categories=labels),
+                         index=series.index)
 
-        # First, try to extract years from numeric values (e.g., 1990, 2005)
-        numeric_values = pd.to_numeric(series, errors='coerce')
-        numeric_year_mask = numeric_values.notna() & (numeric_values >= 1800) & (numeric_values <= 2100)
-        if numeric_year_mask.any():
-            years_ago[numeric_year_mask] = current_year - numeric_values[numeric_year_mask]
-
-        # For non-numeric values, try to parse as dates and extract year
-        non_numeric_mask = ~numeric_year_mask & series.notna() & (series != '') & (series != 'Unknown')
-        if non_numeric_mask.any():
-            # Parse dates with coerce to handle invalid formats
-            parsed_dates = pd.to_datetime(series[non_numeric_mask], errors='coerce')
-
-            # Extract years safely - this returns NaN for NaT values
-            # Use try-except to handle any remaining overflow issues
-            try:
-                extracted_years = parsed_dates.dt.year
-                # Filter to valid year range (1800-2100) to avoid garbage data
-                valid_year_mask = extracted_years.notna() & (extracted_years >= 1800) & (extracted_years <= 2100)
-
-                # Calculate years ago for valid dates
-                valid_indices = extracted_years[valid_year_mask].index
-                years_ago.loc[valid_indices] = current_year - extracted_years[valid_year_mask].values
-            except (OverflowError, ValueError):
-                # If extraction fails, leave those values as NaN (will be categorized as Unknown)
-                pass
-
-        # Create result series filled with Unknown
-        result = pd.Series([ranges[0][1]] * len(series), index=series.index)
-
-        # Process each range
-        for range_label, range_display, min_val, max_val in ranges:
-            if min_val is None:  # Skip Unknown category
-                continue
+    def categorize_dates_vectorized(self, series, ranges):
+        """
+        Vectorized categorization of date column into years-ago ranges.
 
-            if max_val == float('inf'):  # Open-ended ranges
-                mask = years_ago >= min_val
-            else:  # Normal ranges
-                mask = (years_ago >= min_val) & (years_ago < max_val)
+        Returns:
+            Tuple of (range label Series, boolean Series marking dates that
+            fall in a range; unparseable and future dates are both Unknown)
+        """
+        result = self.categorize_date_series(series, ranges)
+        return result.astype(object), result != ranges[0][1]
 
-            result[mask] = range_display
+    def aggregate_chunk(self, df, date_stats):
+        """
+        Categorize one chunk of rows and aggregate it by the dimension columns.
 
-        return result, years_ago.notna()
+        Args:
+            df: Chunk of source rows (already suppression-filtered)
+            date_stats: Date parsing counters, updated in place
+
+        Returns:
+            DataFrame with one row per dimension combination, holding the
+            distress sums and Number_of_Records for this chunk
+        """
+        missing = pd.Series(None, index=df.index, dtype=object)
+
+        # Extract dimension values (string columns)
+        for col in ('FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type'):
+            df[col] = df[col].fillna('Unknown').astype(str) if col in df.columns else 'Unknown'
+
+        # Detect and populate distress indicator columns
+        df = self.detect_distress_vectorized(df)
+
+        # Categorize numeric columns using vectorized operations
+        df['TotalValue_Range'] = self.categorize_value_series(
+            df['totalValue'] if 'totalValue' in df.columns else missing,
+            self.total_value_ranges,
+            value_is_dollar=True
+        ).astype(object)
+
+        df['LTV_Range'] = self.categorize_value_series(
+            df['LTV'] if 'LTV' in df.columns else missing,
+            self.ltv_ranges
+        ).astype(object)
+
+        df['LotSizeSqFt_Range'] = self.categorize_value_series(
+            df['LotSizeSqFt'] if 'LotSizeSqFt' in df.columns else missing,
+            self.lot_size_ranges
+        ).astype(object)
+
+        df['SumLivingAreaSqFt_Range'] = self.categorize_value_series(
+            df['SumLivingAreaSqFt'] if 'SumLivingAreaSqFt' in df.columns else missing,
+            self.living_area_ranges
+        ).astype(object)
+
+        # Categorize date columns using vectorized operations
+        build_date_range, build_valid = self.categorize_dates_vectorized(
+            df['buildDate'] if 'buildDate' in df.columns else missing,
+            self.build_date_ranges
+        )
+        df['BuildDate_Range'] = build_date_range
+        date_stats['buildDate_valid'] += build_valid.sum()
+        date_stats['buildDate_invalid'] += (~build_valid).sum()
+
+        sale_date_range, sale_valid = self.categorize_dates_vectorized(
+            df['saleDate'] if 'saleDate' in df.columns else missing,
+            self.sale_date_ranges
+        )
+        df['SaleDate_Range'] = sale_date_range
+        date_stats['saleDate_valid'] += sale_valid.sum()
+        date_stats['saleDate_invalid'] += (~sale_valid).sum()
+
+        # Sum distress flags and count records per combination
+        grouped = df.groupby(self.DIMENSION_COLUMNS, dropna=False)
+        partial = grouped[self.distress_columns].sum()
+        partial['Number_of_Records'] = grouped.size()
+        return partial.reset_index()
 
     def process_csv_files(self):
         """Process all CSV files and generate the dynamic table (VECTORIZED VERSION)."""
@@ -599,9 +910,10 @@ class DynamicTableGenerator:
             print("ERROR: No CSV files found in the input folder!")
             return
 
-        # Collect all processed dataframes
+        # Collect the per-chunk partial aggregates
         all_processed_dfs = []
         total_rows_suppressed = 0
+        total_rows_processed = 0
 
         # Statistics tracking
         date_stats = {
@@ -618,97 +930,58 @@ class DynamicTableGenerator:
             print(f"{'=' * 80}")
 
             try:
-                # Read CSV
-                print("Loading CSV file...")
-                df = pd.read_csv(csv_file, low_memory=False)
-                print(f"✓ Loaded {len(df):,} rows")
-
-                # Apply suppression filter BEFORE processing rows
-                if self.suppression_records:
-                    print("Applying suppression filter (vectorized)...")
-                    df, file_suppressed = self.filter_suppressed_vectorized(df)
-                    total_rows_suppressed += file_suppressed
-                    print(f"✓ Suppressed {file_suppressed:,} rows, {len(df):,} rows remaining")
-
-                if len(df) == 0:
-                    print("⚠ No rows remaining after suppression, skipping file")
-                    continue
-
-                # VECTORIZED PROCESSING - Process entire columns at once
-                print("Processing data (vectorized operations)...")
-
-                # Extract dimension values (string columns)
-                df['FIPS'] = df['FIPS'].fillna('Unknown').astype(str) if 'FIPS' in df.columns else 'Unknown'
-                df['SitusCity'] = df['SitusCity'].fillna('Unknown').astype(str) if 'SitusCity' in df.columns else 'Unknown'
-                df['SitusZIP5'] = df['SitusZIP5'].fillna('Unknown').astype(str) if 'SitusZIP5' in df.columns else 'Unknown'
-                df['Owner_Type'] = df['Owner_Type'].fillna('Unknown').astype(str) if 'Owner_Type' in df.columns else 'Unknown'
-                df['Use_Type'] = df['Use_Type'].fillna('Unknown').astype(str) if 'Use_Type' in df.columns else 'Unknown'
-
-                # Detect and populate distress indicator columns
-                print("Detecting distress indicators...")
-                df = self.detect_distress_vectorized(df)
-
-                # Categorize numeric columns using vectorized operations
-                df['TotalValue_Range'] = self.categorize_column_vectorized(
-                    df['totalValue'] if 'totalValue' in df.columns else pd.Series([None] * len(df)),
-                    self.total_value_ranges,
-                    value_is_dollar=True
+                # Read the CSV in chunks so memory stays bounded on large files.
+                # Partials and date counters are kept per file and only merged
+                # once the whole file was read, so a file that fails partway
+                # through contributes nothing
+                print(f"Loading CSV file in chunks of {self.CSV_CHUNK_SIZE:,} rows...")
+                file_rows = 0
+                file_suppressed = 0
+                file_processed = 0
+                file_partials = []
+                file_date_stats = dict.fromkeys(date_stats, 0)
+                reader = pd.read_csv(
+                    csv_file,
+                    chunksize=self.CSV_CHUNK_SIZE,
+                    usecols=self.source_columns.__contains__,
+                    dtype=self.SOURCE_DTYPES
                 )
+                for df in reader:
+                    file_rows += len(df)
 
-                df['LTV_Range'] = self.categorize_column_vectorized(
-                    df['LTV'] if 'LTV' in df.columns else pd.Series([None] * len(df)),
-                    self.ltv_ranges
-                )
+                    # Apply suppression filter BEFORE processing rows
+                    if self.suppression_records:
+                        df, chunk_suppressed = self.filter_suppressed_vectorized(df)
+                        file_suppressed += chunk_suppressed
 
-                df['LotSizeSqFt_Range'] = self.categorize_column_vectorized(
-                    df['LotSizeSqFt'] if 'LotSizeSqFt' in df.columns else pd.Series([None] * len(df)),
-                    self.lot_size_ranges
-                )
+                    if len(df) == 0:
+                        continue
 
-                df['SumLivingAreaSqFt_Range'] = self.categorize_column_vectorized(
-                    df['SumLivingAreaSqFt'] if 'SumLivingAreaSqFt' in df.columns else pd.Series([None] * len(df)),
-                    self.living_area_ranges
-                )
+                    file_partials.append(self.aggregate_chunk(df, file_date_stats))
+                    file_processed += len(df)
 
-                # Categorize date columns using vectorized operations
-                build_date_range, build_valid = self.categorize_dates_vectorized(
-                    df['buildDate'] if 'buildDate' in df.columns else pd.Series([None] * len(df)),
-                    self.build_date_ranges
-                )
-                df['BuildDate_Range'] = build_date_range
-                date_stats['buildDate_valid'] += build_valid.sum()
-                date_stats['buildDate_invalid'] += (~build_valid).sum()
+                all_processed_dfs.extend(file_partials)
+                for key, count in file_date_stats.items():
+                    date_stats[key] += count
 
-                sale_date_range, sale_valid = self.categorize_dates_vectorized(
-                    df['saleDate'] if 'saleDate' in df.columns else pd.Series([None] * len(df)),
-                    self.sale_date_ranges
-                )
-                df['SaleDate_Range'] = sale_date_range
-                date_stats['saleDate_valid'] += sale_valid.sum()
-                date_stats['saleDate_invalid'] += (~sale_valid).sum()
-
-                # Select only the columns we need for aggregation
-                dimension_cols = [
-                    'FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type',
-                    'SaleDate_Range', 'BuildDate_Range', 'TotalValue_Range',
-                    'LTV_Range', 'LotSizeSqFt_Range', 'SumLivingAreaSqFt_Range'
-                ]
-
-                # Include distress columns for aggregation (sum counts)
-                aggregation_cols = dimension_cols + self.distress_columns
+                print(f"✓ Loaded {file_rows:,} rows")
+                if self.suppression_records:
+                    total_rows_suppressed += file_suppressed
+                    print(f"✓ Suppressed {file_suppressed:,} rows, {file_processed:,} rows remaining")
 
-                df_agg = df[aggregation_cols].copy()
-                all_processed_dfs.append(df_agg)
+                if file_processed == 0:
+                    print("⚠ No rows remaining after suppression, skipping file")
+                    continue
 
-                print(f"✓ Processed {len(df):,} rows from {csv_file.name} (vectorized)")
+                total_rows_processed += file_processed
+                print(f"✓ Processed {file_processed:,} rows from {csv_file.name} (vectorized)")
 
             except Exception as e:
                 print(f"✗ ERROR processing {csv_file.name}: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error processing %s", csv_file.name)
                 continue
 
-        # Combine all processed dataframes
+        # Combine all partial aggregates
         if not all_processed_dfs:
             print("ERROR: No data was processed!")
             return
@@ -716,36 +989,19 @@ class DynamicTableGenerator:
         print(f"\n{'=' * 80}")
         print("AGGREGATING DATA")
         print(f"{'=' * 80}")
-        print("Combining all dataframes...")
+        print(f"Combining {len(all_processed_dfs)} partial aggregate(s) covering {total_rows_processed:,} total rows...")
         combined_df = pd.concat(all_processed_dfs, ignore_index=True)
-        total_rows_processed = len(combined_df)
 
-        print(f"✓ Combined {len(all_processed_dfs)} file(s) into {total_rows_processed:,} total rows")
-
-        # Aggregate using groupby - MUCH faster than dictionary approach
+        # Partial sums and record counts add up across chunks
         print("Performing aggregation (using groupby)...")
-        dimension_cols = [
-            'FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type',
-            'SaleDate_Range', 'BuildDate_Range', 'TotalValue_Range',
-            'LTV_Range', 'LotSizeSqFt_Range', 'SumLivingAreaSqFt_Range'
-        ]
-
-        # Create aggregation dictionary: sum for distress columns
-        agg_dict = {col: 'sum' for col in self.distress_columns}
-
-        # Perform groupby with aggregation for distress columns
-        output_df = combined_df.groupby(dimension_cols, as_index=False, dropna=False).agg(agg_dict)
-
-        # Add record count column
-        record_counts = combined_df.groupby(dimension_cols, dropna=False).size().reset_index(name='Number_of_Records')
-
-        # Merge record counts with distress sums
-        output_df = output_df.merge(record_counts, on=dimension_cols, how='left')
+        output_df = combined_df.groupby(self.DIMENSION_COLUMNS, as_index=False, dropna=False)[
+            self.distress_columns + ['Number_of_Records']
+        ].sum()
 
         print(f"✓ Created {len(output_df):,} unique combinations")
 
         # Reorder columns: dimensions, distress counts, then record count
-        final_column_order = dimension_cols + self.distress_columns + ['Number_of_Records']
+        final_column_order = self.DIMENSION_COLUMNS + self.distress_columns + ['Number_of_Records']
         output_df = output_df[final_column_order]
 
         print(f"\n{'=' * 80}")
@@ -856,8 +1112,7 @@ def main():
         print("✗ ERROR:")
         print(f"{'=' * 80}")
         print(f"{str(e)}\n")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Dynamic table generation failed")
         sys.exit(1)
 
 
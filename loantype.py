@@ -75,7 +75,7 @@ def main():
 
         # Paso 4: Leer archivos CSV
         console.print_section("Leyendo Archivos CSV")
-        file_reader = FileReader(config.processing)
+        file_reader = FileReader(config.processing, config.columns)
         all_dataframes = []
 
         for folder in folders:
@@ -373,7 +373,7 @@ class DataProcessingApp:
 
             # Step 4: Read CSV files
             console.print_section("Reading CSV Files")
-            file_reader = FileReader(config.processing)
+            file_reader = FileReader(config.processing, config.columns)
             all_dataframes = []
 
             for folder in folders:
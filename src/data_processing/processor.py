@@ -82,7 +82,7 @@ class DataProcessor:
         """
         initial_rows = len(df)
         columns_to_check = self.column_config.address_validation_columns
-        existing_check_cols = [col for col in columns_to_check if col in df.columns]
+        existing_check_cols = [col for col in df.columns if col in columns_to_check]
 
         if not existing_check_cols:
             logger.warning("No address columns found for validation")
@@ -107,8 +107,8 @@ class DataProcessor:
             DataFrame with DistressCounter column added
         """
         distress_existing = [
-            col for col in self.column_config.distress_columns
-            if col in df.columns
+            col for col in df.columns
+            if col in self.column_config.distress_columns_set
         ]
 
         if not distress_existing:
@@ -118,9 +118,13 @@ class DataProcessor:
 
         logger.info(f"Calculating DistressCounter using {len(distress_existing)} distress indicators")
 
-        # Fill NaN with 0 and count boolean True values
-        distress_df = df[distress_existing].fillna(0)
-        df['DistressCounter'] = distress_df.apply(lambda row: row.astype(bool).sum(), axis=1)
+        if len(self.column_config.distress_columns) <= self.column_config.MAX_PACKED_DISTRESS_COLUMNS:
+            # Pack the active indicators into one bitmask per row and popcount it
+            bits = self.column_config.pack_distress(df)
+            df['DistressCounter'] = self.column_config.count_bits(bits).astype('int64')
+        else:
+            # Too many indicators for the bitmask: count truthy values per row
+            df['DistressCounter'] = df[distress_existing].fillna(0).astype(bool).sum(axis=1).astype('int64')
 
         logger.debug(f"DistressCounter range: {df['DistressCounter'].min()} to {df['DistressCounter'].max()}")
 
@@ -212,7 +216,7 @@ class DataProcessor:
         existing_distress = [col for col in distress_columns if col in df.columns]
 
         # Combine display order with distress columns
-        final_order = display_order + existing_distress
+        final_order = [*display_order, *existing_distress]
 
         # Filter to only existing columns
         existing_order = [col for col in final_order if col in df.columns]
@@ -369,7 +373,7 @@ class DataProcessor:
             DataFrame with title-cased text columns
         """
         title_cols = self.column_config.title_case_columns
-        existing_title_cols = [col for col in title_cols if col in df.columns]
+        existing_title_cols = [col for col in df.columns if col in title_cols]
 
         for col in existing_title_cols:
             if pd.api.types.is_string_dtype(df[col]):
@@ -506,7 +510,9 @@ class DataProcessor:
             logger.debug("Checking property addresses against suppression list (vectorized)")
             # Create cleaned address and zip columns in vectorized way
             prop_addr_clean = df[property_addr].fillna('').astype(str).str.strip().str.lower()
-            prop_zip_clean = df[property_zip].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+            # ZIP keys drop a trailing '.0' and leading zeros, so ZIPs read as text
+            # and ZIPs read as numbers (e.g., from Excel) compare equal
+            prop_zip_clean = df[property_zip].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True)
 
             # Create tuples for comparison
             prop_tuples = list(zip(prop_addr_clean, prop_zip_clean))
@@ -522,7 +528,7 @@ class DataProcessor:
             logger.debug("Checking mailing addresses against suppression list (vectorized)")
             # Create cleaned address and zip columns in vectorized way
             mail_addr_clean = df[mailing_addr].fillna('').astype(str).str.strip().str.lower()
-            mail_zip_clean = df[mailing_zip].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+            mail_zip_clean = df[mailing_zip].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True)
 
             # Create tuples for comparison
             mail_tuples = list(zip(mail_addr_clean, mail_zip_clean))
@@ -3,14 +3,17 @@ File operations module for handling CSV, Excel, and other file I/O.
 Provides robust file reading, writing, and duplicate management.
 """
 
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from glob import glob
 from typing import List, Set, Optional, Tuple
 import zipfile
 
 from src.utils.logger import get_logger
-from src.utils.config import ProcessingConfig
+from src.utils.config import ColumnConfig, ProcessingConfig
+from src.file_operations.zip_extraction import MAX_EXTRACT_WORKERS, extract_archive
 
 
 logger = get_logger(__name__)
@@ -19,14 +22,20 @@ logger = get_logger(__name__)
 class FileReader:
     """Handles reading data files (CSV, Excel, etc.)."""
 
-    def __init__(self, processing_config: ProcessingConfig):
+    def __init__(
+        self,
+        processing_config: ProcessingConfig,
+        column_config: Optional[ColumnConfig] = None
+    ):
         """
         Initialize the file reader.
 
         Args:
             processing_config: Processing configuration
+            column_config: Column configuration; when given, only its columns are parsed
         """
         self.processing_config = processing_config
+        self.column_config = column_config
         logger.info("FileReader initialized")
 
     def read_csv_files_from_folder(self, folder_path: Path) -> List[pd.DataFrame]:
@@ -79,8 +88,15 @@ class FileReader:
         """
         try:
             logger.debug(f"Reading CSV file: {file_path.name}")
+            # Parse only configured columns (missing ones are tolerated)
+            usecols = (
+                self.column_config.all_columns_set.__contains__
+                if self.column_config is not None else None
+            )
             df = pd.read_csv(
                 file_path,
+                usecols=usecols,
+                dtype=self.processing_config.dtype_map,
                 low_memory=self.processing_config.low_memory
             )
             logger.debug(f"Read {len(df):,} rows from {file_path.name}")
@@ -265,7 +281,9 @@ class DuplicateManager:
             if property_col:
                 # Clean addresses and zips in vectorized way
                 prop_addr_clean = df[property_col].fillna('').astype(str).str.strip().str.lower()
-                prop_zip_clean = df[property_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True) if property_zip_col else pd.Series([''] * len(df))
+                # ZIP keys drop a trailing '.0' and leading zeros, so ZIPs read as text
+                # and ZIPs read as numbers (e.g., from Excel) compare equal
+                prop_zip_clean = df[property_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True) if property_zip_col else pd.Series([''] * len(df))
 
                 # Filter out empty addresses
                 valid_mask = prop_addr_clean != ''
@@ -280,7 +298,7 @@ class DuplicateManager:
             if mailing_col:
                 # Clean addresses and zips in vectorized way
                 mail_addr_clean = df[mailing_col].fillna('').astype(str).str.strip().str.lower()
-                mail_zip_clean = df[mailing_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True) if mailing_zip_col else pd.Series([''] * len(df))
+                mail_zip_clean = df[mailing_zip_col].fillna('').astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.replace(r'^0+(?=\d)', '', regex=True) if mailing_zip_col else pd.Series([''] * len(df))
 
                 # Filter out empty addresses
                 valid_mask = mail_addr_clean != ''
@@ -409,8 +427,8 @@ class ZipExtractor:
             logger.warning(f"Folder does not exist: {folder_path}")
             return 0
 
-        zip_pattern = str(folder_path / "*.zip")
-        zip_files = glob(zip_pattern)
+        with os.scandir(folder_path) as entries:
+            zip_files = [entry.path for entry in entries if entry.is_file() and entry.name.endswith('.zip')]
 
         if not zip_files:
             logger.info(f"No ZIP files found in: {folder_path}")
@@ -418,11 +436,11 @@ class ZipExtractor:
 
         logger.info(f"Found {len(zip_files)} ZIP file(s) to extract")
 
-        extracted_count = 0
-        for zip_path in zip_files:
-            zip_path = Path(zip_path)
-            if self.extract_zip_file(zip_path, folder_path, remove_after_extract):
-                extracted_count += 1
+        with ThreadPoolExecutor(max_workers=min(MAX_EXTRACT_WORKERS, len(zip_files))) as executor:
+            extracted_count = sum(executor.map(
+                lambda zip_path: self.extract_zip_file(Path(zip_path), folder_path, remove_after_extract),
+                zip_files
+            ))
 
         logger.info(f"Successfully extracted {extracted_count} ZIP file(s)")
 
@@ -448,8 +466,7 @@ class ZipExtractor:
         try:
             logger.info(f"Extracting: {zip_path.name}")
 
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to)
+            extract_archive(zip_path, extract_to)
 
             logger.info(f"Successfully extracted: {zip_path.name}")
 
@@ -0,0 +1,118 @@
+"""
+ZIP extraction helpers shared by the ZipExtractor and the standalone zip.py utility.
+Streams archive members to disk and merges staged extractions into place.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+
+
+# zlib releases the GIL while inflating, so several ZIPs can extract in parallel
+MAX_EXTRACT_WORKERS = 8
+
+# Chunk size used when streaming ZIP members to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+# Serializes move_into: its isdir check and os.replace are not atomic together,
+# so two extractions merging the same subfolder at once could interleave
+_MOVE_LOCK = threading.Lock()
+
+# Optional ISA-L accelerated inflate (pip install isal), used only by
+# stream_members; other zipfile users (e.g. openpyxl) keep the stdlib zlib
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+
+def _open_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """
+    Open a ZIP member for reading, inflating DEFLATE data with ISA-L when available.
+
+    zipfile creates the member's decompressor when it is opened and does not
+    use it until the first read, so it is swapped for an equivalent raw-DEFLATE
+    isal decompressor right after opening. CRC checks stay on zlib.
+    """
+    src = zip_ref.open(info)
+    if isal_zlib is not None and info.compress_type == zipfile.ZIP_DEFLATED:
+        src._decompressor = isal_zlib.decompressobj(-15)
+    return src
+
+
+def stream_members(zip_ref: zipfile.ZipFile, extract_to: Path) -> None:
+    """
+    Stream every member of an open ZIP file into extract_to.
+
+    Each member is copied in COPY_BUFFER_SIZE chunks, so memory stays
+    bounded regardless of member size.
+
+    Args:
+        zip_ref: Open ZIP file
+        extract_to: Directory to extract files to
+
+    Raises:
+        ValueError: If a member would be written outside extract_to
+    """
+    root = Path(extract_to).resolve()
+    for info in zip_ref.infolist():
+        dest = (root / info.filename).resolve()
+        if root != dest and root not in dest.parents:
+            raise ValueError(f"Unsafe path in archive: {info.filename}")
+        if info.is_dir():
+            dest.mkdir(parents=True, exist_ok=True)
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with _open_member(zip_ref, info) as src, open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def move_into(src_dir, dest_dir) -> None:
+    """
+    Move every entry of src_dir into dest_dir, merging existing subfolders.
+
+    Safe to call from parallel extraction workers: only one merge runs at a
+    time. Extraction itself stays parallel; the merge is renames only.
+
+    Args:
+        src_dir: Staging directory to empty
+        dest_dir: Directory receiving the entries
+    """
+    with _MOVE_LOCK:
+        _merge_into(src_dir, dest_dir)
+
+
+def _merge_into(src_dir, dest_dir) -> None:
+    """Recursive body of move_into; the caller holds _MOVE_LOCK."""
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            target = os.path.join(dest_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False) and os.path.isdir(target):
+                _merge_into(entry.path, target)
+            else:
+                os.replace(entry.path, target)
+
+
+def extract_archive(zip_path, dest_dir) -> None:
+    """
+    Extract a ZIP file into dest_dir without leaving partial files on failure.
+
+    Members are streamed into a staging folder inside dest_dir (same
+    filesystem, so the final moves are renames) and merged into place only
+    once the whole archive has been extracted.
+
+    Args:
+        zip_path: Path to the ZIP file
+        dest_dir: Directory to extract files to
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a valid ZIP archive
+        ValueError: If a member would be written outside dest_dir
+    """
+    with tempfile.TemporaryDirectory(dir=dest_dir, prefix='.unzip_') as staging_dir:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            stream_members(zip_ref, Path(staging_dir))
+        move_into(staging_dir, dest_dir)
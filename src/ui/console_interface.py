@@ -3,19 +3,68 @@ Console interface module for user interactions.
 Provides professional console output and user input handling with colors and emojis.
 """
 
+import re
+import sys
+import time
+import numpy as np
 import pandas as pd
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 from colorama import Fore, Back, Style, init
 
 from src.utils.logger import get_logger
 from src.utils.config import LanguageConfig
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+# Color codes bound once at import to avoid module attribute lookups per print
+_RED, _GREEN, _YELLOW, _CYAN, _BLUE, _MAGENTA, _WHITE = (
+    Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.CYAN, Fore.BLUE, Fore.MAGENTA, Fore.WHITE
+)
+_BRIGHT, _RESET = Style.BRIGHT, Style.RESET_ALL
+
+# Width and divider line for headers and summaries
+_BAR_WIDTH = 60
+_BAR = '=' * _BAR_WIDTH
+
+# Minimum progress (percentage points) or time (seconds) between progress lines
+_PROGRESS_MIN_PCT = 1.0
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# Text filter selections above this size skip pandas' isin hashing path
+_LARGE_SELECTION_THRESHOLD = 500
+
+# Filter selection keys, accepted as letters or as the full filter names
+_FILTER_ALIASES = {
+    'o': 'o', 'owner': 'o', 'owner type': 'o',
+    'p': 'p', 'property': 'p', 'property type': 'p',
+    't': 't', 'totalvalue': 't', 'total value': 't',
+}
+
+# colorama is initialized lazily by the first console object (see _ensure_colorama)
+_colorama_ready = False
 
 logger = get_logger(__name__)
 
 
+def _ensure_colorama() -> None:
+    """
+    Initialize colorama on first use.
+
+    When stdout is not a terminal (redirected or piped output) the colorama
+    stdout wrapper is skipped and the color codes are blanked instead.
+    """
+    global _colorama_ready, _RED, _GREEN, _YELLOW, _CYAN, _BLUE, _MAGENTA, _WHITE, _BRIGHT, _RESET
+
+    if _colorama_ready:
+        return
+    _colorama_ready = True
+
+    if sys.stdout.isatty():
+        # Initialize colorama for cross-platform color support
+        init(autoreset=True)
+    else:
+        _RED = _GREEN = _YELLOW = _CYAN = _BLUE = _MAGENTA = _WHITE = ""
+        _BRIGHT = _RESET = ""
+
+
 class ConsoleInterface:
     """Handles console user interface and interactions."""
 
@@ -26,7 +75,25 @@ class ConsoleInterface:
         Args:
             language_config: Language configuration for messages
         """
+        _ensure_colorama()
         self.language_config = language_config
+
+        # Client names must contain at least one non-whitespace character
+        self._name_re = re.compile(r"\S")
+
+        # Precompute message prefixes once instead of rebuilding them per call.
+        # The color codes are already blank when stdout is not a terminal.
+        self._prefix_header = f"{_CYAN}{_BRIGHT}"
+        self._prefix_section = f"{_BLUE}{_BRIGHT}📂 --- "
+        self._prefix_info = f"{_BLUE}ℹ️  "
+        self._prefix_success = f"{_GREEN}{_BRIGHT}✅ "
+        self._prefix_warning = f"{_YELLOW}⚠️  "
+        self._prefix_error = f"{_RED}{_BRIGHT}❌ "
+        self._prefix_prompt = f"{_CYAN}👤 "
+        self._prefix_confirm = f"{_YELLOW}🤔 "
+        self._prefix_error_plain = f"{_RED}❌ "
+        self._reset = _RESET
+
         logger.debug("ConsoleInterface initialized")
 
     def print_header(self, title: str) -> None:
@@ -36,10 +103,11 @@ class ConsoleInterface:
         Args:
             title: Header title
         """
-        width = 60
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * width}")
-        print(f"🏠  {title.center(width - 4)}  🏠")
-        print(f"{'=' * width}{Style.RESET_ALL}\n")
+        sys.stdout.write(
+            f"\n{self._prefix_header}{_BAR}\n"
+            f"🏠  {title.center(_BAR_WIDTH - 4)}  🏠\n"
+            f"{_BAR}{self._reset}\n\n"
+        )
 
     def print_section(self, title: str) -> None:
         """
@@ -48,7 +116,7 @@ class ConsoleInterface:
         Args:
             title: Section title
         """
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}📂 --- {title} ---{Style.RESET_ALL}\n")
+        print(f"\n{self._prefix_section}{title} ---{self._reset}\n")
 
     def print_info(self, message: str, prefix: str = "INFO") -> None:
         """
@@ -58,7 +126,7 @@ class ConsoleInterface:
             message: Message to print
             prefix: Prefix for the message
         """
-        print(f"{Fore.BLUE}ℹ️  {message}{Style.RESET_ALL}")
+        print(f"{self._prefix_info}{message}{self._reset}")
 
     def print_success(self, message: str) -> None:
         """
@@ -67,7 +135,7 @@ class ConsoleInterface:
         Args:
             message: Success message
         """
-        print(f"{Fore.GREEN}{Style.BRIGHT}✅ {message}{Style.RESET_ALL}")
+        print(f"{self._prefix_success}{message}{self._reset}")
 
     def print_warning(self, message: str) -> None:
         """
@@ -76,7 +144,7 @@ class ConsoleInterface:
         Args:
             message: Warning message
         """
-        print(f"{Fore.YELLOW}⚠️  {message}{Style.RESET_ALL}")
+        print(f"{self._prefix_warning}{message}{self._reset}")
 
     def print_error(self, message: str) -> None:
         """
@@ -85,7 +153,7 @@ class ConsoleInterface:
         Args:
             message: Error message
         """
-        print(f"{Fore.RED}{Style.BRIGHT}❌ {message}{Style.RESET_ALL}")
+        print(f"{self._prefix_error}{message}{self._reset}")
 
     def get_client_name(self) -> str:
         """
@@ -97,12 +165,15 @@ class ConsoleInterface:
         msg = self.language_config.get_message('client_prompt')
         empty_msg = self.language_config.get_message('client_empty')
 
+        prompt = f"{self._prefix_prompt}{msg}{self._reset}"
+
         while True:
-            client_name = input(f"{Fore.CYAN}👤 {msg}{Style.RESET_ALL}").strip()
-            if client_name:
+            raw_name = input(prompt)
+            if self._name_re.search(raw_name):
+                client_name = raw_name.strip()
                 logger.info(f"Client name entered: {client_name}")
                 return client_name
-            print(f"{Fore.RED}❌ {empty_msg}{Style.RESET_ALL}")
+            print(f"{self._prefix_error_plain}{empty_msg}{self._reset}")
 
     def confirm_action(self, prompt: str) -> bool:
         """
@@ -114,7 +185,7 @@ class ConsoleInterface:
         Returns:
             True if user confirmed, False otherwise
         """
-        response = input(f"{Fore.YELLOW}🤔 {prompt} (yes/no): {Style.RESET_ALL}").strip().lower()
+        response = input(f"{self._prefix_confirm}{prompt} (yes/no): {self._reset}").strip().lower()
         confirmed = response in ('y', 'yes')
         logger.debug(f"User confirmation for '{prompt}': {confirmed}")
         return confirmed
@@ -125,6 +196,7 @@ class DataFilter:
 
     def __init__(self):
         """Initialize the data filter."""
+        _ensure_colorama()
         logger.debug("DataFilter initialized")
 
     def apply_text_filter(
@@ -145,23 +217,24 @@ class DataFilter:
         initial_count = len(df)
 
         if initial_count == 0:
-            print(f"{Fore.YELLOW}⚠️  No data to filter by {column_name}. Skipping.{Style.RESET_ALL}")
+            print(f"{_YELLOW}⚠️  No data to filter by {column_name}. Skipping.{_RESET}")
             logger.warning(f"Empty dataframe, skipping filter for {column_name}")
             return df
 
         if column_name not in df.columns:
-            print(f"{Fore.YELLOW}⚠️  Column '{column_name}' not found. Skipping filter.{Style.RESET_ALL}")
+            print(f"{_YELLOW}⚠️  Column '{column_name}' not found. Skipping filter.{_RESET}")
             logger.warning(f"Column {column_name} not found in dataframe")
             return df
 
         # Show unique values
-        unique_items = sorted(df[column_name].dropna().unique())
-        print(f"\n{Fore.CYAN}📋 Available values for '{column_name}':{Style.RESET_ALL}")
-        print(f"  {Fore.WHITE}{', '.join(map(str, unique_items))}{Style.RESET_ALL}")
+        unique_items = df[column_name].unique()
+        unique_items = sorted(unique_items[pd.notna(unique_items)])
+        print(f"\n{_CYAN}📋 Available values for '{column_name}':{_RESET}")
+        print(f"  {_WHITE}{', '.join(map(str, unique_items))}{_RESET}")
 
         # Get user input
         desired_items_str = input(
-            f"{Fore.CYAN}🔍 Enter desired '{column_name}' values (comma-separated), or press Enter to skip: {Style.RESET_ALL}"
+            f"{_CYAN}🔍 Enter desired '{column_name}' values (comma-separated), or press Enter to skip: {_RESET}"
         ).strip().lower()
 
         if not desired_items_str:
@@ -175,11 +248,36 @@ class DataFilter:
             logger.warning(f"No valid values provided for {column_name} filter")
             return df
 
-        # Apply filter
-        df_filtered = df[df[column_name].str.lower().isin(desired_list)].copy()
+        # Selecting every available value (with no blanks to drop) keeps all rows
+        desired_set = set(desired_list)
+        unique_items_lower = {str(item).lower() for item in unique_items}
+        if desired_set >= unique_items_lower and not df[column_name].hasnans:
+            print(f"{_GREEN}✅ All values selected. {initial_count:,} rows remaining.{_RESET}\n")
+            logger.info(f"Text filter on {column_name}: all values selected, no rows removed")
+            return df
+
+        # Apply filter. Categorical columns compare integer codes; large
+        # selections use a plain set probe over the raw values.
+        column = df[column_name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            desired_codes = [
+                code for code, category in enumerate(column.cat.categories)
+                if str(category).lower() in desired_set
+            ]
+            mask = np.isin(column.cat.codes.to_numpy(), desired_codes)
+        elif len(desired_set) > _LARGE_SELECTION_THRESHOLD:
+            values = df[column_name].to_numpy()
+            mask = np.fromiter(
+                (isinstance(value, str) and value.lower() in desired_set for value in values),
+                dtype=bool,
+                count=len(values)
+            )
+        else:
+            mask = df[column_name].str.lower().isin(desired_set)
+        df_filtered = df[mask].copy()
 
         removed = initial_count - len(df_filtered)
-        print(f"{Fore.GREEN}✅ Filter applied. Removed {removed:,} rows. {len(df_filtered):,} rows remaining.{Style.RESET_ALL}\n")
+        print(f"{_GREEN}✅ Filter applied. Removed {removed:,} rows. {len(df_filtered):,} rows remaining.{_RESET}\n")
         logger.info(f"Text filter on {column_name}: removed {removed:,} rows")
 
         return df_filtered
@@ -202,25 +300,25 @@ class DataFilter:
         initial_count = len(df)
 
         if initial_count == 0:
-            print(f"{Fore.YELLOW}⚠️  No data to filter by {column_name}. Skipping.{Style.RESET_ALL}")
+            print(f"{_YELLOW}⚠️  No data to filter by {column_name}. Skipping.{_RESET}")
             logger.warning(f"Empty dataframe, skipping filter for {column_name}")
             return df
 
         if column_name not in df.columns:
-            print(f"{Fore.YELLOW}⚠️  Column '{column_name}' not found. Skipping filter.{Style.RESET_ALL}")
+            print(f"{_YELLOW}⚠️  Column '{column_name}' not found. Skipping filter.{_RESET}")
             logger.warning(f"Column {column_name} not found in dataframe")
             return df
 
         # Show current range
         current_min = df[column_name].min()
         current_max = df[column_name].max()
-        print(f"\n{Fore.CYAN}📊 Current range for '{column_name}':{Style.RESET_ALL}")
-        print(f"  {Fore.WHITE}Min = {current_min:,.2f}, Max = {current_max:,.2f}{Style.RESET_ALL}")
+        print(f"\n{_CYAN}📊 Current range for '{column_name}':{_RESET}")
+        print(f"  {_WHITE}Min = {current_min:,.2f}, Max = {current_max:,.2f}{_RESET}")
 
         # Get user input
         try:
-            min_val_str = input(f"{Fore.CYAN}🔢 Enter the minimum value (or press Enter to skip): {Style.RESET_ALL}").strip()
-            max_val_str = input(f"{Fore.CYAN}🔢 Enter the maximum value (or press Enter to skip): {Style.RESET_ALL}").strip()
+            min_val_str = input(f"{_CYAN}🔢 Enter the minimum value (or press Enter to skip): {_RESET}").strip()
+            max_val_str = input(f"{_CYAN}🔢 Enter the maximum value (or press Enter to skip): {_RESET}").strip()
 
             # Use current values if not provided
             min_val = float(min_val_str) if min_val_str else current_min
@@ -229,22 +327,21 @@ class DataFilter:
             # Swap if needed
             if min_val > max_val:
                 min_val, max_val = max_val, min_val
-                print(f"{Fore.YELLOW}⚠️  Minimum is greater than maximum; values have been swapped.{Style.RESET_ALL}")
+                print(f"{_YELLOW}⚠️  Minimum is greater than maximum; values have been swapped.{_RESET}")
                 logger.warning(f"Swapped min/max values for {column_name}")
 
-            # Apply filter
-            df_filtered = df[
-                (df[column_name] >= min_val) & (df[column_name] <= max_val)
-            ].copy()
+            # Apply filter (single fused expression; numexpr is used when installed)
+            mask = df.eval(f"(@min_val <= `{column_name}`) & (`{column_name}` <= @max_val)")
+            df_filtered = df[mask].copy()
 
             removed = initial_count - len(df_filtered)
-            print(f"{Fore.GREEN}✅ Filter applied. Removed {removed:,} rows. {len(df_filtered):,} rows remaining.{Style.RESET_ALL}\n")
+            print(f"{_GREEN}✅ Filter applied. Removed {removed:,} rows. {len(df_filtered):,} rows remaining.{_RESET}\n")
             logger.info(f"Numeric filter on {column_name}: removed {removed:,} rows")
 
             return df_filtered
 
         except ValueError as e:
-            print(f"{Fore.RED}❌ Invalid numeric input. Filter not applied: {e}{Style.RESET_ALL}")
+            print(f"{_RED}❌ Invalid numeric input. Filter not applied: {e}{_RESET}")
             logger.error(f"Invalid numeric input for {column_name} filter: {e}")
             return df
 
@@ -260,6 +357,28 @@ class DataFilter:
         """
         return response.strip().lower() in ('y', 'yes')
 
+    def _parse_filter_choices(self, response: str) -> Set[str]:
+        """
+        Parse a comma-separated filter selection (e.g. "o, t" or "owner, totalvalue").
+
+        Unrecognized entries are reported to the user and ignored.
+
+        Args:
+            response: User input string
+
+        Returns:
+            Set of filter keys ('o', 'p', 't')
+        """
+        tokens = [token.strip() for token in response.lower().split(',')]
+        choices = {_FILTER_ALIASES[token] for token in tokens if token in _FILTER_ALIASES}
+        unknown = [token for token in tokens if token and token not in _FILTER_ALIASES]
+        if unknown:
+            print(f"{_YELLOW}⚠️  Ignoring unknown filter option(s): {', '.join(unknown)}. "
+                  f"Use O, P and/or T.{_RESET}")
+            logger.warning(f"Unknown filter options ignored: {unknown}")
+        logger.debug(f"Filter selection: {sorted(choices)}")
+        return choices
+
     def apply_interactive_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply interactive filters based on user input.
@@ -272,26 +391,40 @@ class DataFilter:
         """
         logger.info("Starting interactive filtering")
 
-        print(f"\n{Fore.MAGENTA}{Style.BRIGHT}🎯 --- Interactive Filters (Optional) ---{Style.RESET_ALL}\n")
-
-        # 1. Owner Type filter
-        response = input(f"{Fore.YELLOW}🤔 Do you want to filter by OWNER TYPE? (yes/no): {Style.RESET_ALL}")
-        if self._is_yes_response(response):
+        print(f"\n{_MAGENTA}{_BRIGHT}🎯 --- Interactive Filters (Optional) ---{_RESET}\n")
+
+        # 1-3. Owner Type / Property Type / Total Value filters (single prompt)
+        choices = self._parse_filter_choices(input(
+            f"{_YELLOW}🤔 Select filters to apply "
+            f"[O=owner, P=property, T=totalvalue, comma-separated], or press Enter to skip: {_RESET}"
+        ))
+
+        # Low-cardinality text columns are filtered as categoricals (integer
+        # codes) and restored to their original dtype afterwards. astype
+        # returns a new frame, so the caller's DataFrame keeps its dtypes.
+        text_filters = [
+            column for key, column in (('o', 'OWNER TYPE'), ('p', 'PROPERTY TYPE'))
+            if key in choices and column in df.columns
+        ]
+        original_dtypes = {column: df[column].dtype for column in text_filters}
+        if text_filters:
+            df = df.astype({column: 'category' for column in text_filters})
+
+        if 'o' in choices:
             df = self.apply_text_filter(df, 'OWNER TYPE')
 
-        # 2. Property Type filter
-        response = input(f"{Fore.YELLOW}🤔 Do you want to filter by PROPERTY TYPE? (yes/no): {Style.RESET_ALL}")
-        if self._is_yes_response(response):
+        if 'p' in choices:
             df = self.apply_text_filter(df, 'PROPERTY TYPE')
 
-        # 3. Total Value filter
-        response = input(f"{Fore.YELLOW}🤔 Do you want to filter by TOTALVALUE? (yes/no): {Style.RESET_ALL}")
-        if self._is_yes_response(response):
+        for column, dtype in original_dtypes.items():
+            df[column] = df[column].astype(dtype)
+
+        if 't' in choices:
             df = self.apply_numeric_filter(df, 'TOTALVALUE')
 
         # 4. Year Built Filter
         if 'YEARBUILT' in df.columns:
-            response = input(f"{Fore.YELLOW}🤔 Do you want to filter by YEAR BUILT? (yes/no): {Style.RESET_ALL}")
+            response = input(f"{_YELLOW}🤔 Do you want to filter by YEAR BUILT? (yes/no): {_RESET}")
             if self._is_yes_response(response):
                 # Ensure it's numeric before filtering
                 df['YEARBUILT'] = pd.to_numeric(df['YEARBUILT'], errors='coerce')
@@ -299,11 +432,11 @@ class DataFilter:
 
         # 5. Years of Ownership Filter (Calculated from SALEDATE)
         if 'SALEDATE' in df.columns:
-            response = input(f"{Fore.YELLOW}🤔 Do you want to filter by YEARS OF OWNERSHIP? (yes/no): {Style.RESET_ALL}")
+            response = input(f"{_YELLOW}🤔 Do you want to filter by YEARS OF OWNERSHIP? (yes/no): {_RESET}")
             if self._is_yes_response(response):
                 try:
                     # Calculate temporary column
-                    print(f"{Fore.CYAN}⏳ Calculating ownership duration...{Style.RESET_ALL}")
+                    print(f"{_CYAN}⏳ Calculating ownership duration...{_RESET}")
                     df['SALEDATE'] = pd.to_datetime(df['SALEDATE'], errors='coerce')
                     current_date = pd.Timestamp.now()
 
@@ -317,7 +450,7 @@ class DataFilter:
                     df.drop(columns=['YEARS_OWNED'], inplace=True)
 
                 except Exception as e:
-                    print(f"{Fore.RED}❌ Error calculating years of ownership: {e}{Style.RESET_ALL}")
+                    print(f"{_RED}❌ Error calculating years of ownership: {e}{_RESET}")
                     logger.error(f"Ownership filter error: {e}")
 
         logger.info("Interactive filtering completed")
@@ -330,8 +463,12 @@ class ProgressTracker:
 
     def __init__(self):
         """Initialize the progress tracker."""
+        _ensure_colorama()
         self.steps_completed = 0
         self.total_steps = 0
+        self._step_template = ""
+        self._last_print_time = 0.0
+        self._last_pct = -1.0
         logger.debug("ProgressTracker initialized")
 
     def set_total_steps(self, total: int) -> None:
@@ -343,6 +480,10 @@ class ProgressTracker:
         """
         self.total_steps = total
         self.steps_completed = 0
+        self._last_print_time = 0.0
+        self._last_pct = -1.0
+        # Static parts of the progress line are formatted once per run
+        self._step_template = f"{_CYAN}⏩ Step {{n}}/{total} ({{pct:.1f}}%): {{msg}}{_RESET}"
         logger.debug(f"Progress tracker set to {total} steps")
 
     def step_completed(self, message: str) -> None:
@@ -353,13 +494,26 @@ class ProgressTracker:
             message: Description of completed step
         """
         self.steps_completed += 1
-        if self.total_steps > 0:
-            percentage = (self.steps_completed / self.total_steps) * 100
-            print(f"{Fore.CYAN}⏩ Step {self.steps_completed}/{self.total_steps} ({percentage:.1f}%): {message}{Style.RESET_ALL}")
-            logger.debug(f"Step {self.steps_completed}/{self.total_steps} completed: {message}")
-        else:
-            print(f"{Fore.CYAN}⏩ {message}{Style.RESET_ALL}")
+
+        if self.total_steps <= 0:
+            # Without a total every message is distinct; nothing to throttle
+            print(f"{_CYAN}⏩ {message}{_RESET}")
             logger.debug(f"Step completed: {message}")
+            return
+
+        percentage = (self.steps_completed / self.total_steps) * 100
+        logger.debug(f"Step {self.steps_completed}/{self.total_steps} completed: {message}")
+
+        # Rate-limit console output only: print on >=1% progress, after 100ms,
+        # or on the last step
+        now = time.monotonic()
+        if (percentage - self._last_pct < _PROGRESS_MIN_PCT
+                and now - self._last_print_time < _PROGRESS_MIN_INTERVAL
+                and self.steps_completed < self.total_steps):
+            return
+        print(self._step_template.format(n=self.steps_completed, pct=percentage, msg=message))
+        self._last_pct = percentage
+        self._last_print_time = now
 
     def print_summary(self, total_records: int, processing_time: Optional[float] = None) -> None:
         """
@@ -369,13 +523,16 @@ class ProgressTracker:
             total_records: Total number of records processed
             processing_time: Optional processing time in seconds
         """
-        print(f"\n{Fore.GREEN}{Style.BRIGHT}{'=' * 60}")
-        print(f"🎉  {'PROCESSING COMPLETE'.center(60 - 4)}  🎉")
-        print(f"{'=' * 60}")
-        print(f"📊 Total records: {total_records:,}")
+        lines = [
+            f"\n{_GREEN}{_BRIGHT}{_BAR}",
+            f"🎉  {'PROCESSING COMPLETE'.center(_BAR_WIDTH - 4)}  🎉",
+            _BAR,
+            f"📊 Total records: {total_records:,}",
+        ]
 
         if processing_time:
-            print(f"⏱️  Processing time: {processing_time:.2f} seconds")
+            lines.append(f"⏱️  Processing time: {processing_time:.2f} seconds")
 
-        print(f"{'=' * 60}{Style.RESET_ALL}\n")
+        lines.append(f"{_BAR}{_RESET}\n\n")
+        sys.stdout.write("\n".join(lines))
         logger.info(f"Processing complete: {total_records:,} records")
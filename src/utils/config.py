@@ -4,48 +4,55 @@ Centralizes all configuration settings, column definitions, and default values.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict
-from dataclasses import dataclass, field
+from sys import intern as _intern
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Set, Tuple
 
+import numpy as np
 
-@dataclass
-class ColumnConfig:
-    """Configuration for data columns and their processing."""
 
-    # Distress indicator columns
-    distress_columns: List[str] = field(default_factory=lambda: [
-        "30-60-Days_Distress", "Absentee", "Bankruptcy_Distress", "Debt-Collection_Distress",
-        "Divorce_Distress", "Downsizing_Distress", "Estate_Distress", "Eviction_Distress",
-        "Failed_Listing_Distress", "highEquity", "Inter_Family_Distress", "Judgment_Distress",
-        "Lien_City_County_Distress", "Lien_HOA_Distress", "Lien_Mechanical_Distress",
-        "Lien_Other_Distress", "Lien_Utility_Distress", "Low_income_Distress",
-        "PoorCondition_Distress", "Preforeclosure_Distress", "Probate_Distress",
-        "Prop_Vacant_Flag", "Senior_Distress", "Tax_Delinquent_Distress", "Violation_Distress"
-    ])
-
-    # Unique identifier columns for deduplication
-    unique1_columns: List[str] = field(default_factory=lambda: [
-        "MailingFullStreetAddress", "MailingZIP5"
-    ])
-
-    unique2_columns: List[str] = field(default_factory=lambda: [
-        "SitusFullStreetAddress", "SitusZIP5"
-    ])
-
-    # FIPS code column
-    fips_column: List[str] = field(default_factory=lambda: ["FIPS"])
-
-    # Key property variables
-    key_variables: List[str] = field(default_factory=lambda: [
-        "LotSizeSqFt", "LTV", "MailingCity", "MailingState", "MailingStreet", "Owner_Type",
-        "Owner1FirstName", "Owner1LastName", "OwnerNAME1FULL", "PropertyID", "saleDate",
-        "SumLivingAreaSqFt", "totalValue", "Use_Type", "YearBuilt", "SitusCity",
-        "SitusState", "Bedrooms", "IsListedFlag"
-    ])
-
-    # Column rename mapping for standardization
-    rename_mapping: Dict[str, str] = field(default_factory=lambda: {
+# Column definitions shared by every ColumnConfig instance. They are never
+# mutated, so they are built once per process as immutable constants.
+# Names are interned so pandas label lookups can match on identity.
+
+
+def _interned(*names: str) -> Tuple[str, ...]:
+    """Return the given column names as a tuple of interned strings."""
+    return tuple(_intern(name) for name in names)
+
+
+# Distress indicator columns
+_DISTRESS_COLUMNS: Tuple[str, ...] = _interned(
+    "30-60-Days_Distress", "Absentee", "Bankruptcy_Distress", "Debt-Collection_Distress",
+    "Divorce_Distress", "Downsizing_Distress", "Estate_Distress", "Eviction_Distress",
+    "Failed_Listing_Distress", "highEquity", "Inter_Family_Distress", "Judgment_Distress",
+    "Lien_City_County_Distress", "Lien_HOA_Distress", "Lien_Mechanical_Distress",
+    "Lien_Other_Distress", "Lien_Utility_Distress", "Low_income_Distress",
+    "PoorCondition_Distress", "Preforeclosure_Distress", "Probate_Distress",
+    "Prop_Vacant_Flag", "Senior_Distress", "Tax_Delinquent_Distress", "Violation_Distress"
+)
+
+# Unique identifier columns for deduplication
+_UNIQUE1_COLUMNS: Tuple[str, ...] = _interned("MailingFullStreetAddress", "MailingZIP5")
+_UNIQUE2_COLUMNS: Tuple[str, ...] = _interned("SitusFullStreetAddress", "SitusZIP5")
+
+# FIPS code column
+_FIPS_COLUMN: Tuple[str, ...] = _interned("FIPS")
+
+# Key property variables
+_KEY_VARIABLES: Tuple[str, ...] = _interned(
+    "LotSizeSqFt", "LTV", "MailingCity", "MailingState", "MailingStreet", "Owner_Type",
+    "Owner1FirstName", "Owner1LastName", "OwnerNAME1FULL", "PropertyID", "saleDate",
+    "SumLivingAreaSqFt", "totalValue", "Use_Type", "YearBuilt", "SitusCity",
+    "SitusState", "Bedrooms", "IsListedFlag"
+)
+
+# Column rename mapping for standardization
+_RENAME_MAPPING: Mapping[str, str] = MappingProxyType({
+    _intern(raw): _intern(display) for raw, display in {
         "SitusFullStreetAddress": "PROPERTY ADDRESS",
         "SitusCity": "PROPERTY CITY",
         "SitusState": "PROPERTY STATE",
@@ -60,52 +67,175 @@ class ColumnConfig:
         "Owner_Type": "OWNER TYPE",
         "Use_Type": "PROPERTY TYPE",
         "IsListedFlag": "LISTED FLAG"
-    })
-
-    # Display order for final output
-    display_order: List[str] = field(default_factory=lambda: [
-        "FIPS", "PropertyID", "SitusFullStreetAddress", "SitusCity", "SitusState", "SitusZIP5",
-        "MailingFullStreetAddress", "MailingCity", "MailingState", "MailingZIP5", "OwnerNAME1FULL",
-        "Owner1FirstName", "Owner1LastName", "Owner_Type", "LotSizeSqFt", "LTV", "saleDate",
-        "SumLivingAreaSqFt", "totalValue", "Use_Type", "YearBuilt", "Bedrooms",
-        "IsListedFlag", "DistressCounter"
-    ])
-
-    # Columns that require address validation (no nulls allowed)
-    address_validation_columns: List[str] = field(default_factory=lambda: [
-        "MailingFullStreetAddress", "MailingZIP5",
-        "SitusFullStreetAddress", "SitusZIP5"
-    ])
-
-    # Text columns that should be title-cased
-    title_case_columns: List[str] = field(default_factory=lambda: [
-        'OWNER TYPE', 'PROPERTY TYPE', 'COUNTY'
-    ])
-
-    def get_all_columns(self) -> List[str]:
+    }.items()
+})
+
+# Reverse lookup: standardized display name -> raw source column
+_INV_RENAME_MAPPING: Mapping[str, str] = MappingProxyType(
+    {display: raw for raw, display in _RENAME_MAPPING.items()}
+)
+
+# Display order for final output
+_DISPLAY_ORDER: Tuple[str, ...] = _interned(
+    "FIPS", "PropertyID", "SitusFullStreetAddress", "SitusCity", "SitusState", "SitusZIP5",
+    "MailingFullStreetAddress", "MailingCity", "MailingState", "MailingZIP5", "OwnerNAME1FULL",
+    "Owner1FirstName", "Owner1LastName", "Owner_Type", "LotSizeSqFt", "LTV", "saleDate",
+    "SumLivingAreaSqFt", "totalValue", "Use_Type", "YearBuilt", "Bedrooms",
+    "IsListedFlag", "DistressCounter"
+)
+
+# Membership-only lookups use frozensets; ordered tuples above are kept
+# wherever iteration order matters (column selection and Excel ordering)
+_DISTRESS_COLUMNS_SET: FrozenSet[str] = frozenset(_DISTRESS_COLUMNS)
+
+# Columns that require address validation (no nulls allowed)
+_ADDRESS_VALIDATION_COLUMNS: FrozenSet[str] = frozenset(_UNIQUE1_COLUMNS + _UNIQUE2_COLUMNS)
+
+# Text columns that should be title-cased
+_TITLE_CASE_COLUMNS: FrozenSet[str] = frozenset(_interned('OWNER TYPE', 'PROPERTY TYPE', 'COUNTY'))
+
+
+class ColumnConfig:
+    """Configuration for data columns and their processing."""
+
+    # pack_distress stores one bit per distress column in a uint32
+    MAX_PACKED_DISTRESS_COLUMNS = 32
+
+    def __init__(self):
+        """Initialize column definitions from the shared module-level constants."""
+        self.distress_columns: Tuple[str, ...] = _DISTRESS_COLUMNS
+        self.distress_columns_set: FrozenSet[str] = _DISTRESS_COLUMNS_SET
+        self.unique1_columns: Tuple[str, ...] = _UNIQUE1_COLUMNS
+        self.unique2_columns: Tuple[str, ...] = _UNIQUE2_COLUMNS
+        self.fips_column: Tuple[str, ...] = _FIPS_COLUMN
+        self.key_variables: Tuple[str, ...] = _KEY_VARIABLES
+        self.display_order: Tuple[str, ...] = _DISPLAY_ORDER
+        self.address_validation_columns: FrozenSet[str] = _ADDRESS_VALIDATION_COLUMNS
+        self.title_case_columns: FrozenSet[str] = _TITLE_CASE_COLUMNS
+
+    @property
+    def rename_mapping(self) -> Mapping[str, str]:
+        """Column rename mapping for standardization (raw -> display name)."""
+        return _RENAME_MAPPING
+
+    @property
+    def inverse_rename_mapping(self) -> Mapping[str, str]:
+        """Reverse of rename_mapping (display name -> raw column)."""
+        return _INV_RENAME_MAPPING
+
+    @cached_property
+    def all_columns(self) -> Tuple[str, ...]:
+        """All columns that should be kept during processing (computed once)."""
+        return (*self.distress_columns,
+                *self.unique1_columns,
+                *self.unique2_columns,
+                *self.fips_column,
+                *self.key_variables)
+
+    @cached_property
+    def all_columns_set(self) -> FrozenSet[str]:
+        """Set view of all_columns for O(1) membership checks."""
+        return frozenset(self.all_columns)
+
+    def get_all_columns(self) -> Tuple[str, ...]:
         """Get all columns that should be kept during processing."""
-        return (self.distress_columns +
-                self.unique1_columns +
-                self.unique2_columns +
-                self.fips_column +
-                self.key_variables)
+        return self.all_columns
+
+    def pack_distress(self, df) -> np.ndarray:
+        """
+        Pack the distress indicators of each row into a uint32 bitmask.
 
+        Bit i is set when distress_columns[i] is present in the DataFrame and
+        holds a truthy value (NaN counts as inactive).
 
-@dataclass
-class ProcessingConfig:
-    """Configuration for data processing parameters."""
+        Args:
+            df: DataFrame containing some or all of the distress columns
+
+        Returns:
+            uint32 array with one bitmask per row
 
-    # Percentage of top records to retain based on distress score
-    percentage_to_retain: float = 0.7
+        Raises:
+            ValueError: If there are more distress columns than bits in a uint32
+        """
+        if len(self.distress_columns) > self.MAX_PACKED_DISTRESS_COLUMNS:
+            raise ValueError(
+                f"Cannot pack {len(self.distress_columns)} distress columns into a "
+                f"{self.MAX_PACKED_DISTRESS_COLUMNS}-bit mask"
+            )
+
+        bits = np.zeros(len(df), dtype=np.uint32)
+        present = df.columns
+        for i, col in enumerate(self.distress_columns):
+            if col in present:
+                active = df[col].fillna(0).astype(bool).to_numpy()
+                bits |= active.astype(np.uint32) << np.uint32(i)
+        return bits
+
+    @staticmethod
+    def count_bits(bits: np.ndarray) -> np.ndarray:
+        """
+        Count the set bits of each element of a uint32 bitmask array.
 
-    # LTV (Loan-to-Value) threshold for filtering
-    ltv_max_threshold: int = 999
+        Args:
+            bits: uint32 array as returned by pack_distress
+
+        Returns:
+            Array with the number of set bits per element
+        """
+        if hasattr(np, "bitwise_count"):
+            return np.bitwise_count(bits)
+        # NumPy < 2.0: unpack the four bytes of each value and sum the bits
+        return np.unpackbits(bits.view(np.uint8)).reshape(-1, 32).sum(axis=1)
+
+
+# Explicit CSV dtypes for free-text and ZIP columns. ZIPs are read as strings
+# so a stray non-numeric value cannot split a column into mixed int/str types,
+# and leading zeros survive. Numeric columns are left to inference: LTV may
+# hold 'Unknown' and FIPS must stay numeric to merge with the FIPS reference file.
+_CSV_DTYPE_MAP: Mapping[str, Any] = MappingProxyType({
+    "PropertyID": str,
+    "OwnerNAME1FULL": str,
+    "Owner1FirstName": str,
+    "Owner1LastName": str,
+    "MailingFullStreetAddress": str,
+    "MailingStreet": str,
+    "MailingCity": str,
+    "MailingState": str,
+    "SitusFullStreetAddress": str,
+    "SitusCity": str,
+    "SitusState": str,
+    "SitusZIP5": str,
+    "MailingZIP5": str,
+})
 
-    # Default encoding for CSV files
-    csv_encoding: str = 'utf-8'
 
-    # Pandas read options
-    low_memory: bool = False
+class ProcessingConfig:
+    """Configuration for data processing parameters."""
+
+    def __init__(
+        self,
+        percentage_to_retain: float = 0.7,
+        ltv_max_threshold: int = 999,
+        csv_encoding: str = 'utf-8',
+        low_memory: bool = False,
+        dtype_map: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize processing parameters.
+
+        Args:
+            percentage_to_retain: Percentage of top records to retain based on distress score
+            ltv_max_threshold: LTV (Loan-to-Value) threshold for filtering
+            csv_encoding: Default encoding for CSV files
+            low_memory: Pandas read option; False infers each unpinned column
+                from the whole file instead of per internal chunk
+            dtype_map: Explicit pandas dtypes for CSV columns (skips type inference)
+        """
+        self.percentage_to_retain = percentage_to_retain
+        self.ltv_max_threshold = ltv_max_threshold
+        self.csv_encoding = csv_encoding
+        self.low_memory = low_memory
+        self.dtype_map = dict(_CSV_DTYPE_MAP) if dtype_map is None else dtype_map
 
     def validate(self) -> None:
         """Validate configuration parameters."""
@@ -116,32 +246,51 @@ class ProcessingConfig:
             raise ValueError("ltv_max_threshold must be positive")
 
 
-@dataclass
-class PathConfig:
-    """Configuration for file paths and directories."""
-
-    # Base directory (project root)
-    base_dir: Path = field(default_factory=lambda: Path.cwd())
+# Cached PathConfig properties that depend on the client name
+_CLIENT_PATH_ATTRS = ('input_path', 'suppress_path', 'output_path')
 
-    # Client name for folder organization
-    client_name: str = ""
+# Directories already created by ensure_directories during this process
+_ENSURED_DIRS: Set[Path] = set()
 
-    # Data folder structure
-    data_folder: str = "customers"
-    input_folder_name: str = "input"
-    raw_data_folder_name: str = "raw_data"  # Subfolder under input
-    suppress_folder_name: str = "suppressed"  # Subfolder under input
-    output_folder_name: str = "output"
 
-    # Reference data
-    fips_filename: str = "FIPs.xlsx"
+class PathConfig:
+    """Configuration for file paths and directories."""
 
-    # Log folder
-    log_folder: str = "logs"
+    def __init__(
+        self,
+        base_dir: Path = None,
+        client_name: str = "",
+        data_folder: str = "customers",
+        input_folder_name: str = "input",
+        raw_data_folder_name: str = "raw_data",
+        suppress_folder_name: str = "suppressed",
+        output_folder_name: str = "output",
+        fips_filename: str = "FIPs.xlsx",
+        log_folder: str = "logs"
+    ):
+        """
+        Initialize path settings.
 
-    def __post_init__(self):
-        """Convert string paths to Path objects."""
-        self.base_dir = Path(self.base_dir)
+        Args:
+            base_dir: Base directory (project root, defaults to current directory)
+            client_name: Client name for folder organization
+            data_folder: Folder holding all customer folders
+            input_folder_name: Input folder name under the client folder
+            raw_data_folder_name: Raw data subfolder under input
+            suppress_folder_name: Suppression subfolder under input
+            output_folder_name: Output folder name under the client folder
+            fips_filename: Reference FIPS file name
+            log_folder: Log folder name
+        """
+        self.base_dir = Path(base_dir) if base_dir is not None else Path.cwd()
+        self.data_folder = data_folder
+        self.input_folder_name = input_folder_name
+        self.raw_data_folder_name = raw_data_folder_name
+        self.suppress_folder_name = suppress_folder_name
+        self.output_folder_name = output_folder_name
+        self.fips_filename = fips_filename
+        self.log_folder = log_folder
+        self.set_client_name(client_name)
 
     def set_client_name(self, client_name: str) -> None:
         """
@@ -151,109 +300,152 @@ class PathConfig:
             client_name: Name of the client
         """
         self.client_name = client_name
+        self._client_dir = self.base_dir / self.data_folder / client_name
 
-    @property
+        # Drop cached client paths so they are rebuilt for the new client
+        for attr in _CLIENT_PATH_ATTRS:
+            self.__dict__.pop(attr, None)
+
+    @cached_property
     def input_path(self) -> Path:
         """Get full input folder path (raw_data subfolder)."""
         if not self.client_name:
             raise ValueError("Client name must be set before accessing input path")
-        return self.base_dir / self.data_folder / self.client_name / self.input_folder_name / self.raw_data_folder_name
+        return self._client_dir / self.input_folder_name / self.raw_data_folder_name
 
-    @property
+    @cached_property
     def suppress_path(self) -> Path:
         """Get full suppress folder path (suppressed subfolder under input)."""
         if not self.client_name:
             raise ValueError("Client name must be set before accessing suppress path")
-        return self.base_dir / self.data_folder / self.client_name / self.input_folder_name / self.suppress_folder_name
+        return self._client_dir / self.input_folder_name / self.suppress_folder_name
 
-    @property
+    @cached_property
     def output_path(self) -> Path:
         """Get full output folder path."""
         if not self.client_name:
             raise ValueError("Client name must be set before accessing output path")
-        return self.base_dir / self.data_folder / self.client_name / self.output_folder_name
+        return self._client_dir / self.output_folder_name
 
-    @property
+    @cached_property
     def fips_file_path(self) -> Path:
         """Get full FIPS file path."""
         return self.base_dir / self.fips_filename
 
-    @property
+    @cached_property
     def log_path(self) -> Path:
         """Get full log folder path."""
         return self.base_dir / self.log_folder
 
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        self.input_path.mkdir(parents=True, exist_ok=True)
-        self.suppress_path.mkdir(parents=True, exist_ok=True)
-        self.output_path.mkdir(parents=True, exist_ok=True)
-        self.log_path.mkdir(parents=True, exist_ok=True)
+        pending = [
+            path for path in (self.input_path, self.suppress_path, self.output_path, self.log_path)
+            if path not in _ENSURED_DIRS
+        ]
+        if not pending:
+            return
+
+        # Independent mkdir calls are issued concurrently (helps on slow/network filesystems)
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            list(executor.map(lambda path: os.makedirs(path, exist_ok=True), pending))
+        _ENSURED_DIRS.update(pending)
+
+
+# Header format for main columns
+_MAIN_HEADER_TEMPLATE: Dict[str, Any] = {
+    'bold': True,
+    'font_color': '#FFFFFF',
+    'bg_color': '#000000',
+    'align': 'center',
+    'valign': 'vcenter',
+    'border': 1
+}
+
+# Header format for distress columns
+_DISTRESS_HEADER_TEMPLATE: Dict[str, Any] = {
+    'bold': True,
+    'font_color': '#000000',
+    'bg_color': '#FFC000',
+    'align': 'center',
+    'valign': 'vcenter',
+    'border': 1
+}
 
 
-@dataclass
 class ExcelFormatConfig:
     """Configuration for Excel output formatting."""
 
-    # Sheet name
-    sheet_name: str = "Consolidated"
-
-    # Header format for main columns
-    main_header_format: Dict[str, any] = field(default_factory=lambda: {
-        'bold': True,
-        'font_color': '#FFFFFF',
-        'bg_color': '#000000',
-        'align': 'center',
-        'valign': 'vcenter',
-        'border': 1
-    })
-
-    # Header format for distress columns
-    distress_header_format: Dict[str, any] = field(default_factory=lambda: {
-        'bold': True,
-        'font_color': '#000000',
-        'bg_color': '#FFC000',
-        'align': 'center',
-        'valign': 'vcenter',
-        'border': 1
-    })
-
-    # Maximum column width
-    max_column_width: int = 50
-
-    # Column width padding
-    column_width_padding: int = 2
-
-
-@dataclass
+    def __init__(self):
+        """Initialize Excel formatting defaults."""
+        # Sheet name
+        self.sheet_name: str = "Consolidated"
+
+        # Header formats (shallow copies of the shared templates)
+        self.main_header_format: Dict[str, Any] = _MAIN_HEADER_TEMPLATE.copy()
+        self.distress_header_format: Dict[str, Any] = _DISTRESS_HEADER_TEMPLATE.copy()
+
+        # Maximum column width
+        self.max_column_width: int = 50
+
+        # Column width padding
+        self.column_width_padding: int = 2
+
+
+# Language-specific messages, one immutable table per language
+_MESSAGES_EN: Mapping[str, str] = MappingProxyType({
+    'start': "Starting the data consolidation and cleaning script...",
+    'client_prompt': "Please enter the client's name: ",
+    'client_empty': "The client's name cannot be empty.",
+    'client_selected': "Client selected: {}",
+    'folders_found': "Found {} folders to process: {}",
+    'processing_complete': "Process completed successfully!",
+})
+
+_MESSAGES_ES: Mapping[str, str] = MappingProxyType({
+    'start': "Iniciando el script de consolidación y limpieza de datos...",
+    'client_prompt': "Por favor ingrese el nombre del cliente: ",
+    'client_empty': "El nombre del cliente no puede estar vacío.",
+    'client_selected': "Cliente seleccionado: {}",
+    'folders_found': "Se encontraron {} carpetas para procesar: {}",
+    'processing_complete': "¡Proceso completado con éxito!",
+})
+
+_MESSAGES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'en': _MESSAGES_EN,
+    'es': _MESSAGES_ES,
+})
+
+
 class LanguageConfig:
     """Configuration for multi-language support."""
 
-    language: str = "en"  # 'en' for English, 'es' for Spanish
-
-    # Language-specific messages
-    messages: Dict[str, Dict[str, str]] = field(default_factory=lambda: {
-        'en': {
-            'start': "Starting the data consolidation and cleaning script...",
-            'client_prompt': "Please enter the client's name: ",
-            'client_empty': "The client's name cannot be empty.",
-            'client_selected': "Client selected: {}",
-            'folders_found': "Found {} folders to process: {}",
-            'processing_complete': "Process completed successfully!",
-        },
-        'es': {
-            'start': "Iniciando el script de consolidación y limpieza de datos...",
-            'client_prompt': "Por favor ingrese el nombre del cliente: ",
-            'client_empty': "El nombre del cliente no puede estar vacío.",
-            'client_selected': "Cliente seleccionado: {}",
-            'folders_found': "Se encontraron {} carpetas para procesar: {}",
-            'processing_complete': "¡Proceso completado con éxito!",
-        }
-    })
+    # Language-specific messages (shared, read-only)
+    messages: Mapping[str, Mapping[str, str]] = _MESSAGES
+
+    def __init__(self, language: str = "en"):
+        """
+        Initialize language settings.
+
+        Args:
+            language: Language code ('en' for English, 'es' for Spanish)
+        """
+        self.language = language
+
+    @property
+    def language(self) -> str:
+        """Configured language code."""
+        return self._language
+
+    @language.setter
+    def language(self, language: str) -> None:
+        # Bind the selected message table once so get_message is a single lookup
+        self._language = language
+        self._active_messages = _MESSAGES.get(language, _MESSAGES_EN)
 
     def get_message(self, key: str) -> str:
         """Get message in the configured language."""
-        return self.messages.get(self.language, self.messages['en']).get(key, key)
+        return self._active_messages.get(key, key)
 
 
 class AppConfig:
@@ -3,13 +3,25 @@ Logging configuration module for the Real Estate Data Processing Tool.
 Provides centralized, professional logging with file and console handlers.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 
+# None of the formats use thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log level names accepted in configuration, resolved without getattr
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+
 class LoggerConfig:
     """Manages application-wide logging configuration."""
 
@@ -32,9 +44,25 @@ class LoggerConfig:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
         self.log_dir = Path(log_dir)
-        self.log_level = getattr(logging, log_level.upper(), logging.INFO)
+        self.log_level = _LEVELS.get(log_level.upper(), logging.INFO)
         self._ensure_log_directory()
 
+        # One dated log file and one handler shared by every configured logger
+        self._log_filename = self.log_dir / f'realestate_processor_{datetime.now():%Y%m%d}.log'
+        self._file_handler = logging.FileHandler(self._log_filename, encoding='utf-8', delay=True)
+        self._file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
+        self._file_handler.setFormatter(_DETAILED_FORMATTER)
+
+        # Loggers only enqueue records; a background listener thread owns the
+        # file handler so disk writes stay off the processing path
+        self._log_queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, self._file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
     def _ensure_log_directory(self) -> None:
         """Create log directory if it doesn't exist."""
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -67,35 +95,27 @@ class LoggerConfig:
         # Console handler
         if console_output:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(self.log_level)
-            console_format = self.DETAILED_FORMAT if detailed_console else self.CONSOLE_FORMAT
-            console_formatter = logging.Formatter(console_format, self.DATE_FORMAT)
-            console_handler.setFormatter(console_formatter)
+            # Piped/CI output only gets warnings and errors; the file log keeps everything
+            if sys.stdout.isatty():
+                console_handler.setLevel(self.log_level)
+            else:
+                console_handler.setLevel(max(self.log_level, logging.WARNING))
+            console_handler.setFormatter(_DETAILED_FORMATTER if detailed_console else _CONSOLE_FORMATTER)
             logger.addHandler(console_handler)
 
         # File handler
         if file_output:
-            log_filename = self._get_log_filename()
-            file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
-            file_formatter = logging.Formatter(self.DETAILED_FORMAT, self.DATE_FORMAT)
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            logger.addHandler(self._queue_handler)
 
         # Prevent propagation to root logger
         logger.propagate = False
 
         return logger
 
-    def _get_log_filename(self) -> Path:
-        """
-        Generate log filename with timestamp.
 
-        Returns:
-            Path to log file
-        """
-        timestamp = datetime.now().strftime('%Y%m%d')
-        return self.log_dir / f'realestate_processor_{timestamp}.log'
+# Shared formatters, created once at import and reused by every handler
+_CONSOLE_FORMATTER = logging.Formatter(LoggerConfig.CONSOLE_FORMAT, LoggerConfig.DATE_FORMAT)
+_DETAILED_FORMATTER = logging.Formatter(LoggerConfig.DETAILED_FORMAT, LoggerConfig.DATE_FORMAT)
 
 
 # Global logger instance factory
@@ -146,7 +166,7 @@ def setup_basic_logging(level: str = 'INFO') -> None:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+        level=_LEVELS.get(level.upper(), logging.INFO),
         format=LoggerConfig.SIMPLE_FORMAT,
         datefmt=LoggerConfig.DATE_FORMAT
     )
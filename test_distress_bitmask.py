@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for the distress bitmask used to compute DistressCounter.
+Run with: python -m pytest -q test_distress_bitmask.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing.processor import DataProcessor
+from src.utils.config import ColumnConfig, ProcessingConfig
+
+
+def _config_with_columns(count):
+    """ColumnConfig with `count` synthetic distress columns."""
+    config = ColumnConfig()
+    config.distress_columns = tuple(f"Distress_{i}" for i in range(count))
+    config.distress_columns_set = frozenset(config.distress_columns)
+    return config
+
+
+def test_pack_distress_counts_all_bits_at_limit():
+    config = _config_with_columns(ColumnConfig.MAX_PACKED_DISTRESS_COLUMNS)
+    df = pd.DataFrame({col: [1, 0, np.nan] for col in config.distress_columns})
+
+    counts = config.count_bits(config.pack_distress(df))
+
+    assert counts.tolist() == [ColumnConfig.MAX_PACKED_DISTRESS_COLUMNS, 0, 0]
+
+
+def test_pack_distress_rejects_columns_past_limit():
+    config = _config_with_columns(ColumnConfig.MAX_PACKED_DISTRESS_COLUMNS + 1)
+    df = pd.DataFrame({col: [1] for col in config.distress_columns})
+
+    with pytest.raises(ValueError):
+        config.pack_distress(df)
+
+
+def test_distress_counter_falls_back_past_limit():
+    config = _config_with_columns(ColumnConfig.MAX_PACKED_DISTRESS_COLUMNS + 1)
+    df = pd.DataFrame({col: [1, 0] for col in config.distress_columns})
+
+    result = DataProcessor(config, ProcessingConfig()).calculate_distress_counter(df)
+
+    assert result['DistressCounter'].tolist() == [ColumnConfig.MAX_PACKED_DISTRESS_COLUMNS + 1, 0]
@@ -3,8 +3,8 @@
 Test the full dynamic table generation process with a sample customer.
 """
 
+import os
 from pathlib import Path
-from dynamic_table_generator import DynamicTableGenerator
 
 # Test with example customer
 customer_name = "example_customer"
@@ -20,11 +20,15 @@ print(f"Input: {input_path}")
 print(f"Output: {output_path}\n")
 
 # Check if input files exist
-csv_files = list(input_path.glob("*.csv"))
+# Single directory walk; DirEntry caches its stat result
+csv_files = []
+if input_path.is_dir():
+    with os.scandir(input_path) as entries:
+        csv_files = [e for e in entries if e.is_file() and e.name.endswith('.csv')]
 print(f"Found {len(csv_files)} CSV file(s):")
-for f in csv_files:
-    size = f.stat().st_size / 1024
-    print(f"  - {f.name} ({size:.1f} KB)")
+for e in csv_files:
+    size = e.stat().st_size / 1024
+    print(f"  - {e.name} ({size:.1f} KB)")
 
 if not csv_files:
     print("\n✗ No CSV files found! Please add files to test.")
@@ -35,6 +39,9 @@ print("RUNNING DYNAMIC TABLE GENERATOR")
 print("=" * 80)
 
 try:
+    # Imported here so the no-CSV exit above does not pay for pandas
+    from dynamic_table_generator import DynamicTableGenerator
+
     generator = DynamicTableGenerator(
         input_folder=str(input_path),
         output_folder=str(output_path),
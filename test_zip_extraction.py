@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared ZIP extraction helpers.
+Run with: python -m pytest -q test_zip_extraction.py
+"""
+
+import os
+import zipfile
+import zlib
+
+import pytest
+
+from src.file_operations import zip_extraction
+
+
+def _write_archive(path, members):
+    """Write a DEFLATE-compressed ZIP with the given {name: bytes} members."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+
+def _members():
+    return {
+        'top.csv': b'a,b\n1,2\n',
+        'nested/dir/big.csv': os.urandom(1 << 16) * 8,
+    }
+
+
+def test_stream_members_extracts_every_member(tmp_path):
+    members = _members()
+    _write_archive(tmp_path / 'data.zip', members)
+
+    with zipfile.ZipFile(tmp_path / 'data.zip') as archive:
+        zip_extraction.stream_members(archive, tmp_path / 'out')
+
+    for name, data in members.items():
+        assert (tmp_path / 'out' / name).read_bytes() == data
+
+
+def test_stream_members_uses_isal_without_patching_zipfile(tmp_path):
+    isal_zlib = pytest.importorskip('isal.isal_zlib')
+    assert zip_extraction.isal_zlib is isal_zlib
+
+    members = _members()
+    _write_archive(tmp_path / 'data.zip', members)
+
+    with zipfile.ZipFile(tmp_path / 'data.zip') as archive:
+        with zip_extraction._open_member(archive, archive.getinfo('top.csv')) as member:
+            assert type(member._decompressor) is type(isal_zlib.decompressobj(-15))
+        zip_extraction.stream_members(archive, tmp_path / 'out')
+
+    # Other zipfile users keep the stdlib zlib
+    assert zipfile.zlib is zlib
+    for name, data in members.items():
+        assert (tmp_path / 'out' / name).read_bytes() == data
+
+
+def test_extract_archive_merges_and_cleans_up(tmp_path):
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'existing.csv').write_bytes(b'keep')
+    members = _members()
+    _write_archive(tmp_path / 'data.zip', members)
+
+    zip_extraction.extract_archive(tmp_path / 'data.zip', tmp_path)
+
+    assert (tmp_path / 'nested' / 'existing.csv').read_bytes() == b'keep'
+    for name, data in members.items():
+        assert (tmp_path / name).read_bytes() == data
+    assert not list(tmp_path.glob('.unzip_*'))
+
+
+def test_extract_archive_leaves_no_partial_files(tmp_path):
+    _write_archive(tmp_path / 'bad.zip', {'ok.csv': b'x', '../escape.csv': b'y'})
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+
+    with pytest.raises(ValueError):
+        zip_extraction.extract_archive(tmp_path / 'bad.zip', dest)
+
+    assert not any(dest.iterdir())
@@ -8,11 +8,33 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from pathlib import Path
+import logging
 import sys
 
 # Import the DynamicTableGenerator
 from dynamic_table_generator import DynamicTableGenerator
 
+logger = logging.getLogger(__name__)
+
+# Columns the CSV processing test needs; everything else is skipped at parse time
+REQUIRED_COLUMNS = [
+    'FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type',
+    'saleDate', 'buildDate', 'totalValue', 'LTV',
+    'LotSizeSqFt', 'SumLivingAreaSqFt'
+]
+REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+
+# Low-cardinality text columns, kept as categoricals (int codes + one shared
+# array of labels). Numeric columns are inferred because they may hold
+# placeholders such as 'Unknown'
+CATEGORY_DTYPES = {
+    'FIPS': 'category',
+    'SitusCity': 'category',
+    'SitusZIP5': 'category',
+    'Owner_Type': 'category',
+    'Use_Type': 'category',
+}
+
 
 class DynamicTableVerifier:
     """Comprehensive verification for the Dynamic Table Generator."""
@@ -41,6 +63,53 @@ class DynamicTableVerifier:
         """Print an info message."""
         print(f"ℹ {message}")
 
+    @staticmethod
+    def category_strings(series, missing='Unknown'):
+        """
+        Get a categorical Series as an array of strings, with missing values filled.
+
+        Only the categories are converted to str; rows are resolved by their
+        codes, and code -1 (missing) indexes the appended placeholder.
+        """
+        labels = np.append(series.cat.categories.astype(str).to_numpy(dtype=object), missing)
+        return labels[series.cat.codes.to_numpy()]
+
+    def check_value_cases(self, test_cases, ranges, value_is_dollar=False, categorize=None):
+        """
+        Validate (value, expected, description) cases in one vectorized call.
+
+        Each case must also give the same result through the scalar path:
+        categorize when given (a specialized categorizer such as
+        categorize_total_value), categorize_value otherwise.
+
+        Returns:
+            Tuple of (passed, failed) counts
+        """
+        inputs = pd.Series([case[0] for case in test_cases], dtype=object)
+        expected = np.array([case[1] for case in test_cases], dtype=object)
+        results = self.generator.categorize_value_series(
+            inputs, ranges, value_is_dollar=value_is_dollar
+        ).to_numpy(dtype=object)
+        mask_ok = results == expected
+
+        if categorize is None:
+            categorize_value = self.generator.categorize_value
+            scalar_results = [categorize_value(value, ranges, value_is_dollar=value_is_dollar) for value in inputs]
+        else:
+            scalar_results = [categorize(value) for value in inputs]
+        scalar_ok = np.array(scalar_results, dtype=object) == results
+
+        for (value, expected_label, description), result, ok, same in zip(test_cases, results, mask_ok, scalar_ok):
+            if not same:
+                self.print_error(f"{description} -> scalar and batch results differ (batch '{result}')")
+            elif ok:
+                self.print_success(f"{description} -> '{result}' (correct)")
+            else:
+                self.print_error(f"{description} -> '{result}' (expected '{expected_label}')")
+
+        passed = int(np.count_nonzero(mask_ok & scalar_ok))
+        return passed, len(test_cases) - passed
+
     def test_date_parsing(self):
         """Test date parsing for various formats."""
         self.print_header("TEST 1: Date Parsing")
@@ -55,39 +124,43 @@ class DynamicTableVerifier:
             ('1950-05-15', 'valid', 'Old date (1950)'),
             ('', 'Unknown', 'Empty string'),
             (None, 'Unknown', 'None value'),
+            (pd.NA, 'Unknown', 'pandas NA value'),
+            (pd.Timestamp('2016-05-01'), 'valid', 'Timestamp value'),
             ('Unknown', 'Unknown', 'String "Unknown"'),
             ('invalid', 'Unknown', 'Invalid date string'),
+            ('2021-13-45', 'Unknown', 'Malformed ISO date'),
             (999999, 'Unknown', 'Invalid year number'),
+            (f'{datetime.now().year + 5}-06-01', 'Unknown', 'Future date'),
         ]
 
-        passed = 0
-        failed = 0
+        # Categorize every case in one vectorized call
+        inputs = pd.Series([case[0] for case in test_cases], dtype=object)
+        expected = np.array([case[1] for case in test_cases], dtype=object)
+        results = self.generator.categorize_date_series(
+            inputs,
+            self.generator.sale_date_ranges
+        ).to_numpy(dtype=object)
+        mask_ok = (results == 'Unknown') == (expected == 'Unknown')
+
+        # The scalar path must agree with the batch path
+        categorize_date = self.generator.categorize_date
+        sale_date_ranges = self.generator.sale_date_ranges
+        scalar_ok = np.array([categorize_date(value, sale_date_ranges) for value in inputs], dtype=object) == results
+
+        for (date_value, expected_type, description), result, ok, same in zip(test_cases, results, mask_ok, scalar_ok):
+            if not same:
+                self.print_error(f"{description}: '{date_value}' scalar and batch results differ (batch '{result}')")
+            elif not ok and expected_type == 'valid':
+                self.print_error(f"{description}: '{date_value}' returned 'Unknown' (expected valid range)")
+            elif not ok:
+                self.print_error(f"{description}: '{date_value}' returned '{result}' (expected 'Unknown')")
+            elif expected_type == 'valid':
+                self.print_success(f"{description}: '{date_value}' -> '{result}'")
+            else:
+                self.print_success(f"{description}: '{date_value}' -> 'Unknown' (correct)")
 
-        for date_value, expected_type, description in test_cases:
-            try:
-                # Test with sale date ranges
-                result = self.generator.categorize_date(
-                    date_value,
-                    self.generator.sale_date_ranges
-                )
-
-                if expected_type == 'valid':
-                    if result != 'Unknown':
-                        self.print_success(f"{description}: '{date_value}' -> '{result}'")
-                        passed += 1
-                    else:
-                        self.print_error(f"{description}: '{date_value}' returned 'Unknown' (expected valid range)")
-                        failed += 1
-                elif expected_type == 'Unknown':
-                    if result == 'Unknown':
-                        self.print_success(f"{description}: '{date_value}' -> 'Unknown' (correct)")
-                        passed += 1
-                    else:
-                        self.print_error(f"{description}: '{date_value}' returned '{result}' (expected 'Unknown')")
-                        failed += 1
-            except Exception as e:
-                self.print_error(f"{description}: Exception - {str(e)}")
-                failed += 1
+        passed = int(np.count_nonzero(mask_ok & scalar_ok))
+        failed = len(test_cases) - passed
 
         print(f"\nDate Parsing Results: {passed} passed, {failed} failed")
         return failed == 0
@@ -107,21 +180,8 @@ class DynamicTableVerifier:
             ('', 'Unknowns', 'Total Value: Empty string'),
         ]
 
-        passed = 0
-        failed = 0
-
-        for value, expected, description in test_values:
-            result = self.generator.categorize_value(
-                value,
-                self.generator.total_value_ranges,
-                value_is_dollar=True
-            )
-            if result == expected:
-                self.print_success(f"{description} -> '{result}' (correct)")
-                passed += 1
-            else:
-                self.print_error(f"{description} -> '{result}' (expected '{expected}')")
-                failed += 1
+        passed, failed = self.check_value_cases(test_values, self.generator.total_value_ranges, value_is_dollar=True,
+                                               categorize=self.generator.categorize_total_value)
 
         # Test Living Area
         print("\nTesting Living Area Categorization:")
@@ -133,17 +193,10 @@ class DynamicTableVerifier:
             (None, 'Unknowns', 'Living Area: None'),
         ]
 
-        for value, expected, description in test_areas:
-            result = self.generator.categorize_value(
-                value,
-                self.generator.living_area_ranges
-            )
-            if result == expected:
-                self.print_success(f"{description} -> '{result}' (correct)")
-                passed += 1
-            else:
-                self.print_error(f"{description} -> '{result}' (expected '{expected}')")
-                failed += 1
+        area_passed, area_failed = self.check_value_cases(test_areas, self.generator.living_area_ranges,
+                                                         categorize=self.generator.categorize_living_area)
+        passed += area_passed
+        failed += area_failed
 
         # Test LTV
         print("\nTesting LTV Categorization:")
@@ -157,17 +210,9 @@ class DynamicTableVerifier:
             (None, 'Unknown', 'LTV: None'),
         ]
 
-        for value, expected, description in test_ltvs:
-            result = self.generator.categorize_value(
-                value,
-                self.generator.ltv_ranges
-            )
-            if result == expected:
-                self.print_success(f"{description} -> '{result}' (correct)")
-                passed += 1
-            else:
-                self.print_error(f"{description} -> '{result}' (expected '{expected}')")
-                failed += 1
+        ltv_passed, ltv_failed = self.check_value_cases(test_ltvs, self.generator.ltv_ranges)
+        passed += ltv_passed
+        failed += ltv_failed
 
         print(f"\nNumeric Categorization Results: {passed} passed, {failed} failed")
         return failed == 0
@@ -177,20 +222,24 @@ class DynamicTableVerifier:
         self.print_header("TEST 3: Years Ago Calculation")
 
         current_year = datetime.now().year
+        # Anchor the N-years-ago dates to this month so the windows hold all year
+        month = datetime.now().month
 
         test_cases = [
             (f'{current_year}-01-01', 0, 1, 'Current year'),
-            (f'{current_year - 5}-06-15', 4.5, 5.5, '5 years ago'),
-            (f'{current_year - 20}-03-20', 19.5, 20.5, '20 years ago'),
-            (f'{current_year - 100}-12-31', 99.5, 100.5, '100 years ago'),
-            ('1950-01-01', 74, 76, 'Very old (1950)'),
+            (f'{current_year - 5}-{month:02d}-01', 4.5, 5.5, '5 years ago'),
+            (f'{current_year - 20}-{month:02d}-01', 19.5, 20.5, '20 years ago'),
+            (f'{current_year - 100}-{month:02d}-01', 99.5, 100.5, '100 years ago'),
+            ('1950-01-01', current_year - 1951, current_year - 1949, 'Very old (1950)'),
         ]
 
         passed = 0
         failed = 0
 
+        calculate_years_ago = self.generator.calculate_years_ago
+
         for date_value, min_expected, max_expected, description in test_cases:
-            years_ago = self.generator.calculate_years_ago(date_value)
+            years_ago = calculate_years_ago(date_value)
             if years_ago is not None and min_expected <= years_ago <= max_expected:
                 self.print_success(f"{description}: {years_ago:.1f} years ago")
                 passed += 1
@@ -212,17 +261,20 @@ class DynamicTableVerifier:
         try:
             # Read a sample of the CSV
             self.print_info(f"Reading CSV file: {csv_file_path}")
-            df = pd.read_csv(csv_file_path, nrows=100, low_memory=False)
+            df = pd.read_csv(
+                csv_file_path,
+                nrows=100,
+                engine='c',
+                usecols=REQUIRED_COLUMN_SET.__contains__,
+                dtype=CATEGORY_DTYPES
+            )
             self.print_success(f"Successfully read {len(df)} rows")
 
             # Check required columns
-            required_columns = [
-                'FIPS', 'SitusCity', 'SitusZIP5', 'Owner_Type', 'Use_Type',
-                'saleDate', 'buildDate', 'totalValue', 'LTV',
-                'LotSizeSqFt', 'SumLivingAreaSqFt'
-            ]
+            required_columns = REQUIRED_COLUMNS
 
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            cols_set = set(df.columns)
+            missing_columns = [col for col in required_columns if col not in cols_set]
 
             if missing_columns:
                 self.print_error(f"Missing required columns: {missing_columns}")
@@ -233,43 +285,32 @@ class DynamicTableVerifier:
             # Test processing a few rows
             self.print_info("\nTesting row processing:")
 
-            valid_dates = 0
-            invalid_dates = 0
-            valid_values = 0
-            invalid_values = 0
-
-            for idx, row in df.head(10).iterrows():
-                # Test date processing
-                sale_date = row.get('saleDate')
-                sale_date_range = self.generator.categorize_date(
-                    sale_date,
-                    self.generator.sale_date_ranges
-                )
-
-                build_date = row.get('buildDate')
-                build_date_range = self.generator.categorize_date(
-                    build_date,
-                    self.generator.build_date_ranges
-                )
-
-                if sale_date_range != 'Unknown':
-                    valid_dates += 1
-                else:
-                    invalid_dates += 1
-
-                # Test value processing
-                total_value = row.get('totalValue')
-                total_value_range = self.generator.categorize_value(
-                    total_value,
-                    self.generator.total_value_ranges,
-                    value_is_dollar=True
-                )
-
-                if total_value_range != 'Unknowns':
-                    valid_values += 1
-                else:
-                    invalid_values += 1
+            sample = df.head(10)
 
+            # Categorize the date and value columns in one vectorized call each
+            sale_date_ranges = self.generator.categorize_date_series(
+                sample['saleDate'],
+                self.generator.sale_date_ranges
+            )
+            build_date_ranges = self.generator.categorize_date_series(
+                sample['buildDate'],
+                self.generator.build_date_ranges
+            )
+            total_value_ranges = self.generator.categorize_value_series(
+                sample['totalValue'],
+                self.generator.total_value_ranges,
+                value_is_dollar=True
+            )
+            valid_dates = int((sale_date_ranges != 'Unknown').sum())
+            valid_values = int((total_value_ranges != 'Unknowns').sum())
+
+            # Iterate zipped column arrays only to print the per-row lines
+            for idx, sale_date, sale_date_range, build_date, build_date_range, total_value, total_value_range in zip(
+                sample.index,
+                sample['saleDate'].to_numpy(), sale_date_ranges.to_numpy(),
+                sample['buildDate'].to_numpy(), build_date_ranges.to_numpy(),
+                sample['totalValue'].to_numpy(), total_value_ranges.to_numpy()
+            ):
                 print(f"  Row {idx}: SaleDate={sale_date} -> {sale_date_range}, "
                       f"BuildDate={build_date} -> {build_date_range}, "
                       f"TotalValue={total_value} -> {total_value_range}")
@@ -280,8 +321,7 @@ class DynamicTableVerifier:
 
         except Exception as e:
             self.print_error(f"Error processing CSV: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing CSV %s", csv_file_path)
             return False
 
     def test_data_integrity(self):
@@ -303,39 +343,60 @@ class DynamicTableVerifier:
             'SumLivingAreaSqFt': [2000, 3000, 1500, 800, 5000]
         }
 
-        df = pd.DataFrame(test_data)
+        df = pd.DataFrame(test_data).astype(CATEGORY_DTYPES)
 
         self.print_info(f"Created test dataframe with {len(df)} rows")
 
-        # Process each row
-        processed_count = 0
-        for idx, row in df.iterrows():
-            # This simulates what the generator does
-            fips = str(row.get('FIPS', 'Unknown'))
-            situs_city = str(row.get('SitusCity', 'Unknown'))
-
-            total_value_range = self.generator.categorize_value(
-                row.get('totalValue'),
-                self.generator.total_value_ranges,
-                value_is_dollar=True
-            )
-
-            sale_date_range = self.generator.categorize_date(
-                row.get('saleDate'),
-                self.generator.sale_date_ranges
-            )
-
-            build_date_range = self.generator.categorize_date(
-                row.get('buildDate'),
-                self.generator.build_date_ranges
-            )
-
-            processed_count += 1
-
+        # Categorize the value and date columns in one vectorized call each
+        total_value_ranges = self.generator.categorize_value_series(
+            df['totalValue'],
+            self.generator.total_value_ranges,
+            value_is_dollar=True
+        )
+        sale_date_ranges = self.generator.categorize_date_series(
+            df['saleDate'],
+            self.generator.sale_date_ranges
+        )
+        build_date_ranges = self.generator.categorize_date_series(
+            df['buildDate'],
+            self.generator.build_date_ranges
+        )
+
+        # This simulates what the generator does
+        fips_values = self.category_strings(df['FIPS'])
+        situs_city_values = self.category_strings(df['SitusCity'])
+
+        # Walk the zipped columns to report each row
+        for idx, fips, situs_city, total_value_range, sale_date_range, build_date_range in zip(
+            df.index,
+            fips_values, situs_city_values,
+            total_value_ranges.to_numpy(), sale_date_ranges.to_numpy(), build_date_ranges.to_numpy()
+        ):
             print(f"  Row {idx}: FIPS={fips}, City={situs_city}, "
                   f"Value={total_value_range}, SaleDate={sale_date_range}, "
                   f"BuildDate={build_date_range}")
 
+        # Count rows per (value, sale date, build date) bucket in one pass:
+        # the category codes are combined into a single composite key
+        value_codes = total_value_ranges.cat.codes.to_numpy(dtype=np.intp)
+        sale_codes = sale_date_ranges.cat.codes.to_numpy(dtype=np.intp)
+        build_codes = build_date_ranges.cat.codes.to_numpy(dtype=np.intp)
+        n_sale = len(sale_date_ranges.cat.categories)
+        n_build = len(build_date_ranges.cat.categories)
+        bucket_counts = np.bincount(
+            (value_codes * n_sale + sale_codes) * n_build + build_codes,
+            minlength=len(total_value_ranges.cat.categories) * n_sale * n_build
+        )
+
+        print("\nRecords per bucket:")
+        for key in np.flatnonzero(bucket_counts):
+            value_code, rest = divmod(key, n_sale * n_build)
+            sale_code, build_code = divmod(rest, n_build)
+            print(f"  Value={total_value_ranges.cat.categories[value_code]}, "
+                  f"SaleDate={sale_date_ranges.cat.categories[sale_code]}, "
+                  f"BuildDate={build_date_ranges.cat.categories[build_code]}: {bucket_counts[key]}")
+
+        processed_count = int(bucket_counts.sum())
         if processed_count == len(df):
             self.print_success(f"All {processed_count} rows processed correctly")
             return True
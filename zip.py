@@ -4,13 +4,19 @@ ZIP File Extraction Utility
 Extracts ZIP files from customer input folders.
 """
 import os
-import zipfile
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from colorama import Fore, Style, init
 
+from src.file_operations.zip_extraction import MAX_EXTRACT_WORKERS, extract_archive
+
 # Initialize colorama for cross-platform color support
 init(autoreset=True)
 
+# Per-file status lines are written to stdout in batches of this many files
+STATUS_FLUSH_EVERY = 16
+
 
 def get_customer_folders():
     """Get list of available customer folders."""
@@ -19,14 +25,38 @@ def get_customer_folders():
     if not customers_dir.exists():
         return []
 
-    customers = []
-    for item in customers_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and item.name != 'README.md':
-            customers.append(item.name)
+    # DirEntry.is_dir() is answered from the directory listing, no extra stat
+    with os.scandir(customers_dir) as entries:
+        customers = [
+            entry.name for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.') and entry.name != 'README.md'
+        ]
 
     return sorted(customers)
 
 
+def _extract_one(zip_path, folder_path):
+    """
+    Extract a single ZIP file into folder_path and delete it.
+
+    Args:
+        zip_path: Path to the ZIP file
+        folder_path: Folder to extract the contents into
+
+    Returns:
+        Tuple of (True if the ZIP was extracted and removed, status line)
+    """
+    try:
+        extract_archive(zip_path, folder_path)
+
+        # Delete the ZIP file after extraction
+        zip_path.unlink()
+        return True, f"{Fore.GREEN}✓ {zip_path.name} extracted and removed{Style.RESET_ALL}"
+
+    except Exception as e:
+        return False, f"{Fore.RED}✗ Error processing {zip_path.name}: {str(e)}{Style.RESET_ALL}"
+
+
 def extract_zips_from_folder(folder_path):
     """
     Extract all ZIP files from a specific folder.
@@ -44,7 +74,8 @@ def extract_zips_from_folder(folder_path):
         return 0
 
     # Get all ZIP files in the folder
-    zip_files = list(folder_path.glob("*.zip"))
+    with os.scandir(folder_path) as entries:
+        zip_files = [Path(entry.path) for entry in entries if entry.is_file() and entry.name.endswith('.zip')]
 
     if not zip_files:
         print(f"{Fore.YELLOW}No ZIP files found in {folder_path}{Style.RESET_ALL}")
@@ -53,23 +84,18 @@ def extract_zips_from_folder(folder_path):
     print(f"{Fore.CYAN}Found {len(zip_files)} ZIP file(s) to extract...{Style.RESET_ALL}\n")
 
     extracted_count = 0
-
-    # Process each ZIP file
-    for zip_path in zip_files:
-        try:
-            print(f"{Fore.BLUE}Extracting {zip_path.name}...{Style.RESET_ALL}")
-
-            # Extract the ZIP file contents to the same folder
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(folder_path)
-
-            # Delete the ZIP file after extraction
-            zip_path.unlink()
-            print(f"{Fore.GREEN}✓ {zip_path.name} extracted and removed{Style.RESET_ALL}")
-            extracted_count += 1
-
-        except Exception as e:
-            print(f"{Fore.RED}✗ Error processing {zip_path.name}: {str(e)}{Style.RESET_ALL}")
+    status_lines = []
+
+    # Process the ZIP files in parallel; status lines are collected on this
+    # thread and written in batches instead of one print per file
+    with ThreadPoolExecutor(max_workers=min(MAX_EXTRACT_WORKERS, len(zip_files))) as executor:
+        for i, (success, line) in enumerate(executor.map(lambda zip_path: _extract_one(zip_path, folder_path), zip_files), 1):
+            extracted_count += success
+            status_lines.append(line)
+            if i % STATUS_FLUSH_EVERY == 0 or i == len(zip_files):
+                sys.stdout.write('\n'.join(status_lines) + '\n')
+                sys.stdout.flush()
+                status_lines.clear()
 
     print(f"\n{Fore.GREEN}Extraction complete: {extracted_count} file(s) processed{Style.RESET_ALL}")
     return extracted_count